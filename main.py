@@ -2,18 +2,57 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
 import shutil
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, List
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
-from src.api import analyze_text_to_dict
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    orjson = None
+    ORJSONResponse = None
+
+from src.api import analyze_text_to_dict, analyze_texts_to_dicts
 from src.ocr_bridge import analyze_file_to_dicts
+from src.padapatha_lookup import load_padapatha_index
+
+logger = logging.getLogger(__name__)
+
+# Largest 'texts' list accepted by /api/analyze/batch
+MAX_BATCH_TEXTS = 256
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm per-process caches before serving, so the first request does not
+    pay for reading dataset_enriched.csv and building its indexes.
+    (chanda_rules.json is already loaded when src.rule_based_classifier
+    is imported.)
+    """
+    try:
+        await asyncio.to_thread(load_padapatha_index)
+    except Exception as e:
+        # E.g. no enriched dataset yet. Serve anyway: lookups retry the
+        # load and report the error per request.
+        logger.warning("Padapatha index warm-up failed: %s", e)
+    yield
 
-app = FastAPI(title="Vedic & Classical Sanskrit Chandas API")
+
+app = FastAPI(
+    title="Vedic & Classical Sanskrit Chandas API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse or JSONResponse,
+)
 
 # CORS for Flutter frontend (adjust origins as needed)
 app.add_middleware(
@@ -25,6 +64,21 @@ app.add_middleware(
 )
 
 
+def _json_response(content: Dict[str, Any]):
+    """
+    Return analysis payloads pre-serialized with orjson when it is available.
+
+    Returning a Response directly skips FastAPI's jsonable_encoder pass,
+    which otherwise walks every per-akṣara dict in Python before the
+    encoder runs; orjson serializes the same structure in C.
+    """
+    if orjson is None:
+        return content
+    # Same options as ORJSONResponse
+    body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return Response(body, media_type="application/json")
+
+
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "Vedic Chandas API running"}
@@ -52,11 +106,51 @@ async def analyze_text_endpoint(payload: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="Missing or empty 'text' field")
 
     analysis = analyze_text_to_dict(text)
-    return {"analysis": analysis}
+    return _json_response({"analysis": analysis})
+
+
+# ---------------- BATCH TEXT ENDPOINT ----------------
+
+@app.post("/api/analyze/batch")
+async def analyze_batch_endpoint(payload: Dict[str, Any]):
+    """
+    Analyze several mantras/shlokas in one request (at most
+    MAX_BATCH_TEXTS; longer lists get a 413).
+
+    Request JSON:
+    {
+        "texts": ["अ॒ग्निमी॑ळे पु॒रोहि॑तं ...", "..."]
+    }
+
+    Response JSON:
+    {
+        "analyses": [ { ... see api.analyze_text_to_dict ... }, ... ]
+    }
+    """
+    texts = payload.get("texts")
+    if not isinstance(texts, list) or not texts:
+        raise HTTPException(status_code=400, detail="Missing or empty 'texts' list")
+    if len(texts) > MAX_BATCH_TEXTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BATCH_TEXTS} texts per request, got {len(texts)}",
+        )
+    if any(not isinstance(t, str) or not t.strip() for t in texts):
+        raise HTTPException(status_code=400, detail="Every entry in 'texts' must be a non-empty string")
+
+    # Analysis is CPU-bound; keep it off the event loop
+    analyses = await asyncio.to_thread(analyze_texts_to_dicts, texts)
+    return _json_response({"analyses": analyses})
 
 
 # ---------------- FILE ENDPOINT ----------------
 
+def _save_upload(upload: UploadFile, dest: Path) -> None:
+    """Copy an uploaded file to `dest` (blocking; run off the event loop)."""
+    with dest.open("wb") as f_out:
+        shutil.copyfileobj(upload.file, f_out)
+
+
 @app.post("/api/analyze/file")
 async def analyze_file_endpoint(
     file: UploadFile = File(...),
@@ -76,14 +170,16 @@ async def analyze_file_endpoint(
     tmp_root = Path("/tmp")  # works on Render & local
     tmp_root.mkdir(parents=True, exist_ok=True)
 
+    # Disk copy and OCR + analysis are blocking; run them in worker threads
+    # so the event loop keeps serving other requests meanwhile.
     tmp_in = tmp_root / f"upload_{file.filename}"
-    with tmp_in.open("wb") as f_out:
-        shutil.copyfileobj(file.file, f_out)
+    await asyncio.to_thread(_save_upload, file, tmp_in)
 
     # Output directory for OCR text files
     out_dir = tmp_root / f"ocr_{tmp_in.stem}"
     try:
-        results = analyze_file_to_dicts(
+        results = await asyncio.to_thread(
+            analyze_file_to_dicts,
             input_path=str(tmp_in),
             out_dir=str(out_dir),
             use_gemini=use_gemini,
@@ -91,7 +187,7 @@ async def analyze_file_endpoint(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error during OCR + analysis: {e}")
 
-    return {
+    return _json_response({
         "file": file.filename,
         "results": results,
-    }
+    })
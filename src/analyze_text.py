@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import os
+import sys
+from typing import Any, Dict, List, Sequence
 
 from tabulate import tabulate
 
-from .normalization import normalize_text
-from .pada_sandhi import split_padas
+from .normalization import normalize_text, to_nfc
+from .pada_sandhi import segment_and_syllabify
 from .syllabifier import syllabify_line
-from .svara_parser import detect_svara_for_akshara_text
+from .svara_parser import svara_sequence_for_aksharas
 from .rule_based_classifier import classify_rule_based
 from .feature_extractor import extract_features_for_mantra, mantra_features_to_dict
 from .padapatha_lookup import get_entry_for_text
@@ -17,6 +19,32 @@ from .padapatha import split_pratishakhya_padas
 
 VEDIC_VEDAS = {"rigveda", "yajurveda", "samaveda", "atharvaveda"}
 
+AKSHARA_HEADERS = ["#", "akṣara", "vowel", "coda", "mātrā", "L/G", "guru_reason", "svara"]
+
+
+def _pretty_tables() -> bool:
+    """
+    Whether to render tables with tabulate.
+
+    CHANDODAYA_PRETTY=1 / =0 forces the choice; otherwise tables are
+    pretty only on an interactive terminal. Piped / batch output gets
+    compact tab-separated rows, which skips tabulate's per-cell width
+    computation.
+    """
+    flag = os.environ.get("CHANDODAYA_PRETTY")
+    if flag is not None:
+        return flag == "1"
+    return sys.stdout.isatty()
+
+
+def _print_table(rows: List[Sequence[Any]], headers: Sequence[str], pretty: bool) -> None:
+    if pretty:
+        print(tabulate(rows, headers=headers, tablefmt="psql"))
+        return
+    print("\t".join(headers))
+    for row in rows:
+        print("\t".join(map(str, row)))
+
 
 def analyze_verse(text: str) -> None:
     """
@@ -30,10 +58,15 @@ def analyze_verse(text: str) -> None:
     - Rule-based meter classification
     - Summary features
     """
+    pretty = _pretty_tables()
+
     print("=== Raw input ===")
     print(text)
     print()
 
+    # Canonicalize to NFC once; all later stages see NFC text
+    text = to_nfc(text)
+
     # 0) Try to identify this mantra in dataset_enriched
     entry: Dict[str, Any] | None = None
     try:
@@ -56,7 +89,7 @@ def analyze_verse(text: str) -> None:
     print()
 
     # 2) Saṁhitā pāda segmentation
-    padas = split_padas(norm)
+    padas = segment_and_syllabify(norm)
     print("=== Pāda segmentation (Saṁhitā) ===")
     for p in padas:
         print(f"Pāda {p.index+1}: {p.text}")
@@ -64,10 +97,11 @@ def analyze_verse(text: str) -> None:
 
     # 3) Akṣaras / L/G / gaṇas for Saṁhitā pādas
     for p in padas:
-        aksharas, LG, ganas = syllabify_line(p.text)
+        svaras = svara_sequence_for_aksharas(p.aksharas)
         rows = []
-        for idx, a in enumerate(aksharas, start=1):
-            svara = detect_svara_for_akshara_text(a.text)
+        for idx, (a, lg, svara) in enumerate(
+            zip(p.aksharas, p.LG, svaras), start=1
+        ):
             rows.append(
                 [
                     idx,
@@ -75,21 +109,15 @@ def analyze_verse(text: str) -> None:
                     a.vowel,
                     a.coda,
                     a.prosodic_matra,
-                    a.L_or_G(),
+                    lg,
                     a.guru_reason,
                     svara,
                 ]
             )
         print(f"=== Akṣaras for Saṁhitā pāda {p.index+1} ===")
-        print(
-            tabulate(
-                rows,
-                headers=["#", "akṣara", "vowel", "coda", "mātrā", "L/G", "guru_reason", "svara"],
-                tablefmt="psql",
-            )
-        )
-        print("L/G pattern:", LG)
-        print("Gaṇas:", "-".join(ganas))
+        _print_table(rows, AKSHARA_HEADERS, pretty)
+        print("L/G pattern:", p.LG)
+        print("Gaṇas:", "-".join(p.ganas))
         print()
 
     # 4) For Vedic mantras: padapāṭha → Prātiśākhya segmentation (from dataset)
@@ -112,9 +140,11 @@ def analyze_verse(text: str) -> None:
 
         for pp in pp_padas:
             aksharas, LG_pp, ganas_pp = syllabify_line(pp.text)
+            svaras = svara_sequence_for_aksharas(aksharas)
             rows = []
-            for idx, a in enumerate(aksharas, start=1):
-                svara = detect_svara_for_akshara_text(a.text)
+            for idx, (a, lg, svara) in enumerate(
+                zip(aksharas, LG_pp, svaras), start=1
+            ):
                 rows.append(
                     [
                         idx,
@@ -122,19 +152,13 @@ def analyze_verse(text: str) -> None:
                         a.vowel,
                         a.coda,
                         a.prosodic_matra,
-                        a.L_or_G(),
+                        lg,
                         a.guru_reason,
                         svara,
                     ]
                 )
             print(f"=== Akṣaras for padapāṭha-pada {pp.index+1} ===")
-            print(
-                tabulate(
-                    rows,
-                    headers=["#", "akṣara", "vowel", "coda", "mātrā", "L/G", "guru_reason", "svara"],
-                    tablefmt="psql",
-                )
-            )
+            _print_table(rows, AKSHARA_HEADERS, pretty)
             print("L/G pattern:", LG_pp)
             print("Gaṇas:", "-".join(ganas_pp))
             print()
@@ -152,6 +176,7 @@ def analyze_verse(text: str) -> None:
         transliteration=entry.get("text_roman") if entry else None,
         veda_profile=entry.get("veda_profile", "adhoc") if entry else "adhoc",
         domain=entry.get("domain", "adhoc") if entry else "adhoc",
+        pre_normalized=norm,
     )
     feat_dict = mantra_features_to_dict(feats)
 
@@ -183,7 +208,7 @@ def analyze_verse(text: str) -> None:
         ("has_stobha", feat_dict["has_stobha"]),
         ("has_special_H", feat_dict["has_special_H"]),
     ]
-    print(tabulate(summary_rows, headers=["feature", "value"], tablefmt="psql"))
+    _print_table(summary_rows, ["feature", "value"], pretty)
     print()
 
 
@@ -17,19 +17,56 @@ This version is:
 
 from __future__ import annotations
 
+import copy
+from operator import attrgetter
 from typing import Dict, Any, List, Optional
 
-from .normalization import normalize_text
-from .pada_sandhi import split_padas
-from .syllabifier import syllabify_line
-from .svara_parser import detect_svara_for_akshara_text, svara_sequence_for_aksharas
+from .normalization import normalize_text, to_nfc
+from .pada_sandhi import segment_and_syllabify
+from .syllabifier import Akshara, syllabify_line
+from .svara_parser import svara_sequence_for_aksharas
 from .feature_extractor import extract_features_for_mantra, mantra_features_to_dict
 from .rule_based_classifier import classify_rule_based
-from .padapatha_lookup import get_entry_for_text
+from .padapatha_lookup import get_entry_for_text, load_padapatha_index
 from .padapatha import split_pratishakhya_padas
 
 VEDIC_VEDAS = {"rigveda", "yajurveda", "samaveda", "atharvaveda"}
 
+_AKSHARA_FIELDS = attrgetter(
+    "text", "vowel", "coda", "prosodic_matra", "phonetic_matra", "guru_reason"
+)
+
+
+def _akshara_dicts(aksharas: List[Akshara], LG: str) -> List[Dict[str, Any]]:
+    """
+    Per-akṣara JSON records (1-based index, fields, L/G and svara).
+
+    `LG` is the pāda's L/G string from the syllabifier, i.e. one character
+    per akṣara in the same order; it is read directly instead of calling
+    `Akshara.L_or_G()` per item. Field access goes through one C-level
+    attrgetter call per akṣara instead of six attribute lookups in bytecode.
+    """
+    svaras = svara_sequence_for_aksharas(aksharas)
+    return [
+        {
+            "index": idx,
+            "text": text,
+            "vowel": vowel,
+            "coda": coda,
+            "prosodic_matra": pros,
+            "phonetic_matra": phon,
+            "L_or_G": lg,
+            "guru_reason": reason,
+            "svara": svara,
+        }
+        for idx, (text, vowel, coda, pros, phon, reason), lg, svara in zip(
+            range(1, len(aksharas) + 1),
+            map(_AKSHARA_FIELDS, aksharas),
+            LG,
+            svaras,
+        )
+    ]
+
 
 def analyze_text_to_dict(text_dev: str) -> Dict[str, Any]:
     """
@@ -55,10 +92,24 @@ def analyze_text_to_dict(text_dev: str) -> Dict[str, Any]:
         - features (global)
         - meter_rule_based
     """
-    # 0) Lookup in dataset_enriched, if available
+    # 0) Canonicalize to NFC once at the boundary. Everything below works on
+    #    NFC text, so the NFC step inside normalize_text is a quick-check
+    #    no-op and repeated normalizations of the same input share cache hits.
+    text_nfc = to_nfc(text_dev)
+
+    # Normalization (keep svaras for accent parsing); computed once and
+    # reused for the dataset lookup below
+    norm_with_svara = normalize_text(text_nfc, strip_svaras=False)
+    norm_no_svara = normalize_text(text_nfc, strip_svaras=True)
+
+    # 1) Lookup in dataset_enriched, if available
     entry: Optional[Dict[str, Any]] = None
     try:
-        entry = get_entry_for_text(text_dev)
+        entry = get_entry_for_text(
+            text_nfc,
+            norm_with_svara=norm_with_svara,
+            norm_no_svara=norm_no_svara,
+        )
     except Exception:
         entry = None
 
@@ -83,38 +134,18 @@ def analyze_text_to_dict(text_dev: str) -> Dict[str, Any]:
         veda_profile = "adhoc"
         domain = "adhoc"
 
-    # 1) Normalization (keep svaras for accent parsing)
-    norm_with_svara = normalize_text(text_dev, strip_svaras=False)
-    norm_no_svara = normalize_text(text_dev, strip_svaras=True)
-
     # 2) Saṁhitā pāda segmentation
     samhita_padas_struct: List[Dict[str, Any]] = []
-    padas = split_padas(norm_with_svara)
+    padas = segment_and_syllabify(norm_with_svara)
 
     for p in padas:
-        aksharas, LG, ganas = syllabify_line(p.text)
-        ak_list = []
-        svaras = svara_sequence_for_aksharas(aksharas)
-        for idx, a in enumerate(aksharas, start=1):
-            ak_list.append(
-                {
-                    "index": idx,
-                    "text": a.text,
-                    "vowel": a.vowel,
-                    "coda": a.coda,
-                    "prosodic_matra": a.prosodic_matra,
-                    "phonetic_matra": a.phonetic_matra,
-                    "L_or_G": a.L_or_G(),
-                    "guru_reason": a.guru_reason,
-                    "svara": svaras[idx - 1] if idx - 1 < len(svaras) else None,
-                }
-            )
+        ak_list = _akshara_dicts(p.aksharas, p.LG)
         samhita_padas_struct.append(
             {
                 "index": p.index + 1,
                 "text": p.text,
-                "LG": LG,
-                "ganas": ganas,
+                "LG": p.LG,
+                "ganas": p.ganas,
                 "aksharas": ak_list,
                 "sandhi_profile": p.sandhi_profile,
             }
@@ -129,22 +160,7 @@ def analyze_text_to_dict(text_dev: str) -> Dict[str, Any]:
         pp_padas = split_pratishakhya_padas(padapatha_text)
         for pp in pp_padas:
             aksharas, LG_pp, ganas_pp = syllabify_line(pp.text)
-            ak_list = []
-            svaras_pp = svara_sequence_for_aksharas(aksharas)
-            for idx, a in enumerate(aksharas, start=1):
-                ak_list.append(
-                    {
-                        "index": idx,
-                        "text": a.text,
-                        "vowel": a.vowel,
-                        "coda": a.coda,
-                        "prosodic_matra": a.prosodic_matra,
-                        "phonetic_matra": a.phonetic_matra,
-                        "L_or_G": a.L_or_G(),
-                        "guru_reason": a.guru_reason,
-                        "svara": svaras_pp[idx - 1] if idx - 1 < len(svaras_pp) else None,
-                    }
-                )
+            ak_list = _akshara_dicts(aksharas, LG_pp)
             padapatha_struct["pratishakhya_padas"].append(
                 {
                     "index": pp.index + 1,
@@ -159,12 +175,13 @@ def analyze_text_to_dict(text_dev: str) -> Dict[str, Any]:
     feats = extract_features_for_mantra(
         mantra_id=mantra_id,
         source_veda=detected_source_veda,
-        text_dev=text_dev,
+        text_dev=text_nfc,
         padapatha=padapatha_text,
         chanda_raw=chanda_raw,
         transliteration=transliteration,
         veda_profile=veda_profile,
         domain=domain,
+        pre_normalized=norm_with_svara,
     )
     feat_dict = mantra_features_to_dict(feats)
 
@@ -210,3 +227,40 @@ def analyze_text_to_dict(text_dev: str) -> Dict[str, Any]:
         # raw chandas label from dataset if present
         "meter_gold_raw": chanda_raw,
     }
+
+
+def analyze_texts_to_dicts(texts: List[str]) -> List[Dict[str, Any]]:
+    """
+    Batch variant of `analyze_text_to_dict`.
+
+    Identical inputs are analyzed only once; each repeat gets its own deep
+    copy of the result, so callers may modify the dicts. The dataset index
+    is loaded up front, and it, the rules and the normalization caches are
+    process-wide, so every text runs on warm state.
+
+    Parameters
+    ----------
+    texts : List[str]
+        Devanagari inputs.
+
+    Returns
+    -------
+    List[dict]
+        One `analyze_text_to_dict` result per input, in input order.
+    """
+    # Same policy as the per-text lookup: a missing or unreadable dataset
+    # just means no matches.
+    try:
+        load_padapatha_index()
+    except Exception:
+        pass
+
+    by_text: Dict[str, Dict[str, Any]] = {}
+    results = []
+    for t in texts:
+        if t in by_text:
+            results.append(copy.deepcopy(by_text[t]))
+        else:
+            by_text[t] = analyze_text_to_dict(t)
+            results.append(by_text[t])
+    return results
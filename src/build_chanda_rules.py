@@ -28,14 +28,32 @@ import os
 from collections import Counter
 from typing import List, Dict, Any, Tuple, Optional
 
+import numpy as np
 import pandas as pd
 
+# Optional fast JSON serializer; stdlib json is used when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Project directories
 ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
 DATA_DIR = os.path.join(ROOT_DIR, "data")
 PROCESSED_DIR = os.path.join(DATA_DIR, "processed")
 RULES_JSON_PATH = os.path.join(PROCESSED_DIR, "chanda_rules.json")
 
+# The only dataset_enriched columns rule building touches, with the dtypes
+# they are parsed as. Everything else in the (wide) CSV is skipped.
+RULE_COLUMN_DTYPES: Dict[str, str] = {
+    "meter_gold_base": "string",
+    "meter_variant_prefixes": "string",
+    "meter_deviation": "string",
+    "meter_gold_raw": "string",
+    "syllable_count_per_pada": "string",
+    "pada_count": "Int16",
+}
+
 
 def _parse_syllable_pattern(s: str) -> Optional[Tuple[int, ...]]:
     """
@@ -54,37 +72,81 @@ def _parse_syllable_pattern(s: str) -> Optional[Tuple[int, ...]]:
     return tuple(out)
 
 
-def _build_full_chanda_label(row: pd.Series) -> Optional[str]:
+def _parse_syllable_patterns(col: pd.Series) -> pd.Series:
+    """
+    Vectorized `_parse_syllable_pattern` over a whole column.
+
+    The corpus repeats a small set of distinct pattern strings, so we
+    factorize the column, parse each distinct value once and broadcast
+    the results back with a single NumPy take.
+    """
+    codes, uniques = pd.factorize(col)
+    # Object array filled element-wise so equal-length tuples are not
+    # broadcast into a 2-D array; the trailing slot serves code -1 (NaN).
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    for i, u in enumerate(uniques):
+        parsed[i] = _parse_syllable_pattern(u)
+    return pd.Series(parsed[codes], index=col.index, dtype=object)
+
+
+def _max_pattern_deviation(
+    patterns: List[Tuple[int, ...]],
+    canonical: Tuple[int, ...],
+) -> int:
+    """
+    Largest per-pāda syllable deviation of `patterns` from `canonical`.
+
+    Patterns of the canonical length are compared element-wise in one
+    NumPy reduction; a length mismatch counts as a deviation of
+    max(len(pattern), len(canonical)).
+    """
+    n_canon = len(canonical)
+    lengths = np.fromiter((len(p) for p in patterns), dtype=np.int64, count=len(patterns))
+    same_len = lengths == n_canon
+
+    diffs = np.where(same_len, 0, np.maximum(lengths, n_canon))
+    if n_canon and same_len.any():
+        arr = np.array([p for p, keep in zip(patterns, same_len) if keep], dtype=np.int64)
+        diffs[same_len] = np.abs(arr - np.asarray(canonical, dtype=np.int64)).max(axis=1)
+
+    return int(diffs.max())
+
+
+def _str_column(df: pd.DataFrame, col: str) -> pd.Series:
     """
-    Build a canonical "full chanda label" for a row.
+    Column `col` as stripped strings, with missing values (or a missing
+    column) mapped to "".
+    """
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype="string")
+    return df[col].astype("string").fillna("").str.strip()
+
+
+def build_full_chanda_labels(df: pd.DataFrame) -> pd.Series:
+    """
+    Build a canonical "full chanda label" for every row, vectorized.
 
     Priority:
     1. If meter_gold_base is present, combine:
        [meter_deviation] + meter_variant_prefixes + meter_gold_base
        e.g. "svaraj brahmi trishtubh"
 
-    2. Else if meter_gold_raw is present, return that stripped.
+    2. Else if meter_gold_raw is present, use that stripped.
 
-    3. Else return None.
+    3. Else <NA>.
     """
-    base = row.get("meter_gold_base")
-    variants = row.get("meter_variant_prefixes")
-    deviation = row.get("meter_deviation")
-    raw = row.get("meter_gold_raw")
-
-    if isinstance(base, str) and base.strip():
-        parts = []
-        if isinstance(deviation, str) and deviation.strip():
-            parts.append(deviation.strip())
-        if isinstance(variants, str) and variants.strip():
-            parts.extend(variants.strip().split())
-        parts.append(base.strip())
-        return " ".join(parts)
-
-    if isinstance(raw, str) and raw.strip():
-        return raw.strip()
+    base = _str_column(df, "meter_gold_base")
+    variants = _str_column(df, "meter_variant_prefixes")
+    deviation = _str_column(df, "meter_deviation")
+    raw = _str_column(df, "meter_gold_raw")
 
-    return None
+    combined = (
+        (deviation + " " + variants + " " + base)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+    label = combined.where(base != "", raw)
+    return label.mask(label == "")
 
 
 def build_chanda_rules(
@@ -106,14 +168,18 @@ def build_chanda_rules(
         Set to 1 to literally include all labels; raise to 3+ to ignore
         ultra-rare labels if desired.
     """
-    df = pd.read_csv(dataset_path)
+    df = pd.read_csv(
+        dataset_path,
+        usecols=lambda c: c in RULE_COLUMN_DTYPES,
+        dtype=RULE_COLUMN_DTYPES,
+    )
 
     # Construct full label
-    df["full_label"] = df.apply(_build_full_chanda_label, axis=1)
+    df["full_label"] = build_full_chanda_labels(df)
     df = df.dropna(subset=["full_label"])
 
     # Compute parsed syllable pattern
-    df["syll_pattern"] = df["syllable_count_per_pada"].apply(_parse_syllable_pattern)
+    df["syll_pattern"] = _parse_syllable_patterns(df["syllable_count_per_pada"])
 
     rules: List[Dict[str, Any]] = []
 
@@ -141,15 +207,7 @@ def build_chanda_rules(
             canonical_pattern = pattern_counts.most_common(1)[0][0]
 
             # Compute maximum deviation from canonical
-            diffs = []
-            for pat in patterns:
-                if len(pat) != len(canonical_pattern):
-                    # length mismatch -> treat as large difference
-                    diffs.append(max(len(pat), len(canonical_pattern)))
-                    continue
-                diffs.append(max(abs(a - b) for a, b in zip(pat, canonical_pattern)))
-            if diffs:
-                max_diff_tolerance = max(diffs)
+            max_diff_tolerance = _max_pattern_deviation(patterns, canonical_pattern)
 
         # Base family = most common meter_gold_base in this group
         base_fam = None
@@ -171,8 +229,13 @@ def build_chanda_rules(
         )
 
     os.makedirs(os.path.dirname(output_json), exist_ok=True)
-    with open(output_json, "w", encoding="utf-8") as f:
-        json.dump(rules, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # Same layout as json.dump(..., ensure_ascii=False, indent=2)
+        with open(output_json, "wb") as fb:
+            fb.write(orjson.dumps(rules, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_json, "w", encoding="utf-8") as f:
+            json.dump(rules, f, ensure_ascii=False, indent=2)
 
     print(f"Wrote {len(rules)} chanda rules to {output_json}")
 
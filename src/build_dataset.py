@@ -32,47 +32,241 @@ text_dev_original, text_dev_normalized, text_dev_padapatha, text_roman,
 meter_gold_raw, meter_gold_base, meter_variant_prefixes, meter_deviation,
 deviation_vector,
 pada_count, syllable_count_per_pada, L_G_sequence, gana_sequence,
-accent_pattern, has_pluti, has_stobha, has_special_H, sandhi_profile
+accent_pattern, has_pluti, has_stobha, has_special_H, sandhi_profile,
+text_dev_normalized_no_svara
 """
 
 from __future__ import annotations
 
+import csv
+import math
 import os
-from typing import List, Any, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import lru_cache
+from typing import List, Any, Iterable, Iterator, Optional, Tuple
 
 import pandas as pd
 
-from .feature_extractor import extract_features_for_mantra, mantra_features_to_dict
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from .feature_extractor import (
+    MantraFeatures,
+    extract_features_for_mantra,
+    mantra_features_to_dict,
+)
 from .chanda_parser import parse_chanda_cell, compute_deviation_D
+from .normalization import normalize_text
 
 # Project-relative data directory (vedic-chandas/data)
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 
 
-def _rigveda_id(row) -> str:
-    """Rigveda ID format: RV-Mandal.Sukta.MantraNumber (e.g. RV-1.1.1)"""
-    return f"RV-{row['Mandal']}.{row['Sukta']}.{row['Mantra Number']}"
+# Columns the build reads from each input CSV (any others are skipped
+# at parse time). Optional/alternative names are listed too; read_csv
+# simply ignores those that a given file does not have.
+_TEXT_COLUMNS = ["MantraText", "Mantra", "Padpath", "PadPath", "Chanda"]
+RIG_COLUMNS = ["Mandal", "Sukta", "Mantra Number", *_TEXT_COLUMNS, "Transliteration"]
+YAJ_COLUMNS = ["Adhyay", "Mantra Number", *_TEXT_COLUMNS]
+SAMA_COLUMNS = ["Mantra Number", *_TEXT_COLUMNS]
 
 
-def _yajurveda_id(row) -> str:
-    """Yajurveda ID format: YV-Adhyay.MantraNumber (e.g. YV-1.1)"""
-    return f"YV-{row['Adhyay']}.{row['Mantra Number']}"
+def _read_input_csv(path: str, columns: List[str]) -> pd.DataFrame:
+    """Read only `columns` (those present) from an input CSV."""
+    wanted = set(columns)
+    return pd.read_csv(path, usecols=lambda c: c in wanted)
 
 
-def _samaveda_id(row) -> str:
-    """Samaveda ID format: SV-MantraNumber (e.g. SV-2)"""
-    return f"SV-{row['Mantra Number']}"
+def _id_column(df: pd.DataFrame, prefix: str, id_columns: List[str]) -> List[str]:
+    """
+    Mantra IDs for every row, built column-wise: `prefix` followed by the
+    `id_columns` values joined with '.'.
+
+    Formats:
+        Rigveda   : RV-Mandal.Sukta.MantraNumber (e.g. RV-1.1.1)
+        Yajurveda : YV-Adhyay.MantraNumber       (e.g. YV-1.1)
+        Samaveda  : SV-MantraNumber              (e.g. SV-2)
+    """
+    ids = df[id_columns[0]].astype(str)
+    for col in id_columns[1:]:
+        ids = ids + "." + df[col].astype(str)
+    return (prefix + ids).tolist()
 
 
-def _get_first_existing(row, candidates: Iterable[str], default: Any = "") -> Any:
+def _first_existing_column(
+    df: pd.DataFrame, candidates: Iterable[str], default: Any = ""
+) -> List[Any]:
     """
-    Safe helper: from a pandas Series (row), return the first column that exists
-    among `candidates`. If none exist, return `default`.
+    Values of the first column among `candidates` that exists in `df`, as a
+    plain list. If none exist, every row gets `default`.
+
+    Column presence is resolved once per DataFrame, so the row loops can
+    zip plain lists instead of building a pandas Series per row.
     """
     for name in candidates:
-        if name in row.index:
-            return row[name]
-    return default
+        if name in df.columns:
+            return df[name].tolist()
+    return [default] * len(df)
+
+
+# Output column order: MantraFeatures fields, then the parsed-chanda
+# columns that _process_row adds when the chanda cell parses, then the
+# svara-stripped lookup key precomputed for padapatha_lookup.
+OUTPUT_COLUMNS: List[str] = [
+    f.name for f in fields(MantraFeatures) if f.name != "first_pada_syllables"
+] + [
+    "meter_gold_base",
+    "meter_variant_prefixes",
+    "meter_deviation",
+    "deviation_vector",
+    "text_dev_normalized_no_svara",
+]
+
+
+# Non-string output columns (for the Parquet schema); all others are text
+_TYPED_COLUMNS = {
+    "pada_count": "int64",
+    "has_pluti": "bool",
+    "has_stobha": "bool",
+    "has_special_H": "bool",
+}
+
+# Rows per Parquet row group when streaming the enriched dataset
+PARQUET_ROW_GROUP_SIZE = 65536
+
+
+def _is_missing(v: Any) -> bool:
+    return v is None or (isinstance(v, float) and math.isnan(v))
+
+
+def _csv_row(feat_dict: dict) -> dict:
+    """Blank out missing values (None / NaN) the way DataFrame.to_csv does."""
+    return {
+        k: "" if _is_missing(v) else v
+        for k, v in feat_dict.items()
+    }
+
+
+@lru_cache(maxsize=8192)
+def _resolve_chanda(
+    chanda_raw: str, first_pada_syllables: Optional[int]
+) -> Optional[Tuple[Optional[str], str, Optional[str], str]]:
+    """
+    Parsed-chanda output columns for one (chanda cell, first pāda count).
+
+    Returns (meter_gold_base, meter_variant_prefixes, meter_deviation,
+    deviation_vector), or None if the cell yields no chanda. Rows share a
+    small set of labels and counts, so the whole parse + deviation step is
+    memoized.
+    """
+    parsed_list = parse_chanda_cell(chanda_raw)
+    if not parsed_list:
+        return None
+    parsed = parsed_list[0]  # global/base meter
+    parsed = compute_deviation_D(parsed, first_pada_syllables)
+    return (
+        parsed.base_meter,
+        " ".join(parsed.variant_prefixes),
+        parsed.deviation_label,
+        "" if parsed.deviation_D is None else str(parsed.deviation_D),
+    )
+
+
+def _process_row(args: Tuple[Any, ...]) -> dict:
+    """
+    Compute the enriched record for one mantra.
+
+    Stobha detection (Sāma and otherwise) is done once, by
+    `extract_features_for_mantra` against STOBHA_PARTICLES.
+
+    `args` is (mantra_id, source_veda, text_dev, padpath, chanda_raw,
+    transliteration, veda_profile, domain). Top-level and tuple-driven so
+    it can be shipped to worker processes.
+    """
+    (
+        mantra_id,
+        source_veda,
+        text_dev,
+        padpath,
+        chanda_raw,
+        translit,
+        veda_profile,
+        domain,
+    ) = args
+
+    feats = extract_features_for_mantra(
+        mantra_id=mantra_id,
+        source_veda=source_veda,
+        text_dev=text_dev,
+        padapatha=padpath,
+        chanda_raw=chanda_raw,
+        transliteration=translit,
+        veda_profile=veda_profile,
+        domain=domain,
+    )
+    feat_dict = mantra_features_to_dict(feats)
+    first_pada_syllables = feat_dict.pop("first_pada_syllables")
+
+    # Svara-stripped lookup key, exactly as padapatha_lookup derives it from
+    # text_dev_normalized, so loading the dataset needs no per-row work.
+    feat_dict["text_dev_normalized_no_svara"] = normalize_text(
+        feat_dict["text_dev_normalized"], strip_svaras=True
+    )
+
+    # Parse chanda and compute deviation based on first pāda syllable count
+    if chanda_raw:
+        resolved = _resolve_chanda(str(chanda_raw), first_pada_syllables)
+        if resolved is not None:
+            (
+                feat_dict["meter_gold_base"],
+                feat_dict["meter_variant_prefixes"],
+                feat_dict["meter_deviation"],
+                feat_dict["deviation_vector"],
+            ) = resolved
+
+    return feat_dict
+
+
+def _veda_tasks(
+    df: pd.DataFrame,
+    *,
+    id_prefix: str,
+    id_columns: List[str],
+    source_veda: str,
+    veda_profile: str,
+    domain: str,
+    with_transliteration: bool = False,
+) -> List[Tuple[Any, ...]]:
+    """
+    `_process_row` argument tuples for every mantra in one veda's DataFrame.
+
+    Column choices are resolved once here; the row loop only zips lists.
+    """
+    n = len(df)
+    translit = (
+        _first_existing_column(df, ["Transliteration"], default=None)
+        if with_transliteration
+        else [None] * n
+    )
+    return [
+        (
+            mantra_id, source_veda, str(text_dev),
+            padpath, chanda_raw, roman, veda_profile, domain,
+        )
+        for mantra_id, text_dev, padpath, chanda_raw, roman in zip(
+            _id_column(df, id_prefix, id_columns),
+            # Text column: try 'MantraText' first, then 'Mantra'
+            _first_existing_column(df, ["MantraText", "Mantra"]),
+            _first_existing_column(df, ["Padpath", "PadPath"], default=None),
+            _first_existing_column(df, ["Chanda"], default=None),
+            translit,
+        )
+    ]
 
 
 def build_enriched_dataset(
@@ -80,9 +274,13 @@ def build_enriched_dataset(
     yaj_csv: str,
     sama_csv: str,
     output_csv: str,
+    max_workers: Optional[int] = None,
+    output_format: str = "csv",
+    parquet_copy: bool = True,
 ) -> None:
     """
-    Main entrypoint: read three CSVs, compute features, write combined CSV.
+    Main entrypoint: read three CSVs, compute features, write combined CSV
+    (or Parquet).
 
     Parameters
     ----------
@@ -90,146 +288,145 @@ def build_enriched_dataset(
         Paths to input CSVs (Rigveda.csv / Yajurveda.csv / Samveda.csv).
     output_csv : str
         Path for enriched CSV.
+    max_workers : int, optional
+        Worker processes for feature extraction (default: one per CPU).
+        Use 1 to run serially in this process.
+    output_format : {"csv", "parquet"}, default "csv"
+        "parquet" writes a zstd-compressed Parquet file to `output_csv`
+        instead (requires pyarrow). CSV stays the default because the
+        lookup and training code read dataset_enriched.csv.
+    parquet_copy : bool, default True
+        With CSV output and pyarrow installed, also write the same rows to
+        a Parquet file next to it (same name, .parquet), in the same pass.
+        The training scripts read that copy when it is up to date.
     """
-    rows: List[dict] = []
+    if output_format not in ("csv", "parquet"):
+        raise ValueError(f"output_format must be 'csv' or 'parquet', got {output_format!r}")
+
+    tasks: List[Tuple[Any, ...]] = []
 
     # --- Rigveda ---
-    rig_df = pd.read_csv(rig_csv)
-    for _, r in rig_df.iterrows():
-        mantra_id = _rigveda_id(r)
-
-        # Text column: try 'MantraText' first, then 'Mantra'
-        text_dev = str(_get_first_existing(r, ["MantraText", "Mantra"]))
-
-        padpath = _get_first_existing(r, ["Padpath", "PadPath"], default=None)
-        chanda_raw = _get_first_existing(r, ["Chanda"], default=None)
-        translit = _get_first_existing(r, ["Transliteration"], default=None)
-
-        feats = extract_features_for_mantra(
-            mantra_id=mantra_id,
-            source_veda="rigveda",
-            text_dev=text_dev,
-            padapatha=padpath,
-            chanda_raw=chanda_raw,
-            transliteration=translit,
-            veda_profile="rig_shakala",
-            domain="samhita",
-        )
-        feat_dict = mantra_features_to_dict(feats)
-
-        # Parse chanda and compute deviation based on first pāda syllable count
-        parsed_list = parse_chanda_cell(chanda_raw or "")
-        if parsed_list:
-            parsed = parsed_list[0]  # global/base meter
-            try:
-                first_pada_syllables = int(
-                    str(feat_dict["syllable_count_per_pada"]).split(",")[0]
-                )
-            except Exception:
-                first_pada_syllables = None
-            parsed = compute_deviation_D(parsed, first_pada_syllables)
-
-            feat_dict["meter_gold_base"] = parsed.base_meter
-            feat_dict["meter_variant_prefixes"] = " ".join(parsed.variant_prefixes)
-            feat_dict["meter_deviation"] = parsed.deviation_label
-            feat_dict["deviation_vector"] = (
-                "" if parsed.deviation_D is None else str(parsed.deviation_D)
-            )
-
-        rows.append(feat_dict)
+    tasks.extend(_veda_tasks(
+        _read_input_csv(rig_csv, RIG_COLUMNS),
+        id_prefix="RV-",
+        id_columns=["Mandal", "Sukta", "Mantra Number"],
+        source_veda="rigveda",
+        veda_profile="rig_shakala",
+        domain="samhita",
+        with_transliteration=True,
+    ))
 
     # --- Yajurveda ---
-    yaj_df = pd.read_csv(yaj_csv)
-    for _, r in yaj_df.iterrows():
-        mantra_id = _yajurveda_id(r)
-
-        text_dev = str(_get_first_existing(r, ["MantraText", "Mantra"]))
-        padpath = _get_first_existing(r, ["Padpath", "PadPath"], default=None)
-        chanda_raw = _get_first_existing(r, ["Chanda"], default=None)
-
-        feats = extract_features_for_mantra(
-            mantra_id=mantra_id,
-            source_veda="yajurveda",
-            text_dev=text_dev,
-            padapatha=padpath,
-            chanda_raw=chanda_raw,
-            transliteration=None,
-            veda_profile="yaj_madhyandina",  # adjust if needed
-            domain="samhita",
-        )
-        feat_dict = mantra_features_to_dict(feats)
-
-        parsed_list = parse_chanda_cell(chanda_raw or "")
-        if parsed_list:
-            parsed = parsed_list[0]
-            try:
-                first_pada_syllables = int(
-                    str(feat_dict["syllable_count_per_pada"]).split(",")[0]
-                )
-            except Exception:
-                first_pada_syllables = None
-            parsed = compute_deviation_D(parsed, first_pada_syllables)
-            feat_dict["meter_gold_base"] = parsed.base_meter
-            feat_dict["meter_variant_prefixes"] = " ".join(parsed.variant_prefixes)
-            feat_dict["meter_deviation"] = parsed.deviation_label
-            feat_dict["deviation_vector"] = (
-                "" if parsed.deviation_D is None else str(parsed.deviation_D)
-            )
-
-        rows.append(feat_dict)
+    tasks.extend(_veda_tasks(
+        _read_input_csv(yaj_csv, YAJ_COLUMNS),
+        id_prefix="YV-",
+        id_columns=["Adhyay", "Mantra Number"],
+        source_veda="yajurveda",
+        veda_profile="yaj_madhyandina",  # adjust if needed
+        domain="samhita",
+    ))
 
     # --- Samaveda ---
-    sama_df = pd.read_csv(sama_csv)
-    for _, r in sama_df.iterrows():
-        mantra_id = _samaveda_id(r)
-
-        text_dev = str(_get_first_existing(r, ["MantraText", "Mantra"]))
-        padpath = _get_first_existing(r, ["Padpath", "PadPath"], default=None)
-        chanda_raw = _get_first_existing(r, ["Chanda"], default=None)
-
-        feats = extract_features_for_mantra(
-            mantra_id=mantra_id,
-            source_veda="samaveda",
-            text_dev=text_dev,
-            padapatha=padpath,
-            chanda_raw=chanda_raw,
-            transliteration=None,
-            veda_profile="sama_kauthuma",
-            domain="saman",
-        )
-        feat_dict = mantra_features_to_dict(feats)
-
-        parsed_list = parse_chanda_cell(chanda_raw or "")
-        if parsed_list:
-            parsed = parsed_list[0]
-            try:
-                first_pada_syllables = int(
-                    str(feat_dict["syllable_count_per_pada"]).split(",")[0]
-                )
-            except Exception:
-                first_pada_syllables = None
-            parsed = compute_deviation_D(parsed, first_pada_syllables)
-            feat_dict["meter_gold_base"] = parsed.base_meter
-            feat_dict["meter_variant_prefixes"] = " ".join(parsed.variant_prefixes)
-            feat_dict["meter_deviation"] = parsed.deviation_label
-            feat_dict["deviation_vector"] = (
-                "" if parsed.deviation_D is None else str(parsed.deviation_D)
-            )
-
-        # Stobha detection for Sāma (very approximate)
-        text = text_dev
-        if any(s in text for s in ["हो", "हि", "है", "हौ", "ओ"]):
-            feat_dict["has_stobha"] = True
-
-        rows.append(feat_dict)
-
-    out_df = pd.DataFrame(rows)
+    tasks.extend(_veda_tasks(
+        _read_input_csv(sama_csv, SAMA_COLUMNS),
+        id_prefix="SV-",
+        id_columns=["Mantra Number"],
+        source_veda="samaveda",
+        veda_profile="sama_kauthuma",
+        domain="saman",
+    ))
 
     os.makedirs(os.path.dirname(output_csv), exist_ok=True)
-    out_df.to_csv(output_csv, index=False)
+    rows = _enriched_rows(tasks, max_workers)
+    if output_format == "parquet":
+        _write_parquet(rows, output_csv)
+    elif parquet_copy and pa is not None:
+        parquet_path = os.path.splitext(output_csv)[0] + ".parquet"
+        _write_parquet(_tee_csv(rows, output_csv), parquet_path)
+        print(f"Parquet copy written to {parquet_path}")
+    else:
+        _write_csv(rows, output_csv)
+
     print(f"Enriched dataset written to {output_csv}")
 
 
+def _enriched_rows(
+    tasks: List[Tuple[Any, ...]], max_workers: Optional[int]
+) -> Iterator[dict]:
+    """
+    Yield enriched records for `tasks`, in order.
+
+    Rows are independent and CPU-bound; fan them out across processes.
+    Executor.map keeps input order, so the output row order is unchanged,
+    and each row can be written as soon as it is ready.
+    """
+    if max_workers == 1:
+        for t in tasks:
+            yield _process_row(t)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            yield from ex.map(_process_row, tasks, chunksize=128)
+
+
+def _write_csv(rows: Iterable[dict], path: str) -> None:
+    for _ in _tee_csv(rows, path):
+        pass
+
+
+def _tee_csv(rows: Iterable[dict], path: str) -> Iterator[dict]:
+    """Write `rows` to a CSV at `path`, passing each row on once written."""
+    with open(path, "w", newline="", encoding="utf-8") as out_f:
+        writer = csv.DictWriter(
+            out_f, fieldnames=OUTPUT_COLUMNS, restval="", lineterminator="\n"
+        )
+        writer.writeheader()
+        for feat_dict in rows:
+            writer.writerow(_csv_row(feat_dict))
+            yield feat_dict
+
+
+def _parquet_value(col: str, v: Any) -> Any:
+    # Empty strings too: the CSV writes them as empty fields, which
+    # read_csv loads as NaN, so both copies load the same frame
+    if _is_missing(v) or (isinstance(v, str) and v == ""):
+        return None
+    return v if col in _TYPED_COLUMNS else str(v)
+
+
+def _write_parquet(rows: Iterable[dict], path: str) -> None:
+    """
+    Stream rows into a zstd-compressed Parquet file, one row group per
+    PARQUET_ROW_GROUP_SIZE rows. Missing values and empty strings become
+    nulls (as they load from the CSV); text columns are stored as strings.
+    """
+    if pa is None:
+        raise ImportError(
+            "Writing Parquet requires pyarrow. Install it with `pip install pyarrow`."
+        )
+    schema = pa.schema(
+        [(col, _TYPED_COLUMNS.get(col, "string")) for col in OUTPUT_COLUMNS]
+    )
+
+    def _column_batch(batch: List[dict]) -> "pa.Table":
+        return pa.table(
+            {
+                col: [_parquet_value(col, d.get(col)) for d in batch]
+                for col in OUTPUT_COLUMNS
+            },
+            schema=schema,
+        )
+
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        batch: List[dict] = []
+        for feat_dict in rows:
+            batch.append(feat_dict)
+            if len(batch) >= PARQUET_ROW_GROUP_SIZE:
+                writer.write_table(_column_batch(batch))
+                batch = []
+        if batch:
+            writer.write_table(_column_batch(batch))
+
+
 if __name__ == "__main__":
     # Default paths for your renamed CSVs:
     rig = os.path.join(DATA_DIR, "raw", "only_Rigveda.csv")
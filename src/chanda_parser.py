@@ -43,7 +43,8 @@ If it doesn't, but D matches, we infer the deviation label.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 
 
 # --- Base meter family and their target syllables per pāda ---
@@ -125,6 +126,14 @@ DEVANAGARI_DEVIATION_TOKENS: Dict[str, str] = {
 }
 
 
+# Both Devanagari tables merged for a single lookup in normalize_label;
+# base meter forms take precedence, as they are checked first there.
+_DEVANAGARI_LABEL_MAP: Dict[str, str] = {
+    **DEVANAGARI_DEVIATION_TOKENS,
+    **DEVANAGARI_BASE_METER_MAP,
+}
+
+
 @dataclass
 class ParsedChanda:
     raw: str
@@ -134,6 +143,24 @@ class ParsedChanda:
     deviation_D: Optional[int]
 
 
+# Romanization diacritics -> plain ASCII, applied in one str.translate pass
+_ASCII_TOKEN_TABLE = str.maketrans({
+    "ā": "a",
+    "ī": "i",
+    "ū": "u",
+    "ṛ": "r",
+    "ṝ": "r",
+    "ṅ": "n",
+    "ñ": "n",
+    "ś": "sh",
+    "ṣ": "sh",
+    "ṭ": "t",
+    "ḍ": "d",
+    "’": "",
+    "'": "",
+})
+
+
 def _normalize_ascii_token(tok: str) -> str:
     """
     Normalize an ASCII/romanized token into a lowercase identifier.
@@ -141,21 +168,7 @@ def _normalize_ascii_token(tok: str) -> str:
     This is used for both base meter names and deviation labels when
     the token is not directly present in the Devanagari lookup tables.
     """
-    l_ascii = (
-        tok.replace("ā", "a")
-        .replace("ī", "i")
-        .replace("ū", "u")
-        .replace("ṛ", "r")
-        .replace("ṝ", "r")
-        .replace("ṅ", "n")
-        .replace("ñ", "n")
-        .replace("ś", "sh")
-        .replace("ṣ", "sh")
-        .replace("ṭ", "t")
-        .replace("ḍ", "d")
-        .replace("’", "")
-        .replace("'", "")
-    )
+    l_ascii = tok.translate(_ASCII_TOKEN_TABLE)
     return l_ascii.lower()
 
 
@@ -173,13 +186,10 @@ def normalize_label(label: str) -> str:
     if not l:
         return ""
 
-    # 1) Exact Devanagari base meter form
-    if l in DEVANAGARI_BASE_METER_MAP:
-        return DEVANAGARI_BASE_METER_MAP[l]
-
-    # 2) Explicit Devanagari deviation form?
-    if l in DEVANAGARI_DEVIATION_TOKENS:
-        return DEVANAGARI_DEVIATION_TOKENS[l]
+    # 1) + 2) Exact Devanagari base meter / deviation form (one lookup)
+    hit = _DEVANAGARI_LABEL_MAP.get(l)
+    if hit is not None:
+        return hit
 
     # 3) ASCII-ish fallback
     return _normalize_ascii_token(l)
@@ -219,8 +229,34 @@ def parse_chanda_cell(raw_cell: str) -> List[ParsedChanda]:
     if not raw_cell:
         return []
 
-    components = [c.strip() for c in str(raw_cell).split(",") if c.strip()]
-    parsed: List[ParsedChanda] = []
+    # Fresh objects per call: callers (compute_deviation_D) mutate them.
+    return [
+        ParsedChanda(
+            raw=raw,
+            base_meter=base_meter,
+            variant_prefixes=list(variants),
+            deviation_label=deviation_label,
+            deviation_D=None,
+        )
+        for raw, base_meter, variants, deviation_label in _parse_chanda_cell_cached(
+            str(raw_cell)
+        )
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _parse_chanda_cell_cached(
+    cell: str,
+) -> Tuple[Tuple[str, Optional[str], Tuple[str, ...], Optional[str]], ...]:
+    """
+    Memoized core of `parse_chanda_cell`, returning immutable
+    (raw, base_meter, variant_prefixes, deviation_label) tuples.
+
+    A corpus has a few hundred distinct chanda cells repeated across
+    thousands of mantras, so each distinct cell is tokenized once.
+    """
+    components = [c.strip() for c in cell.split(",") if c.strip()]
+    parsed = []
 
     for comp in components:
         tokens = comp.split()
@@ -238,17 +274,9 @@ def parse_chanda_cell(raw_cell: str) -> List[ParsedChanda]:
             elif tok:
                 variants.append(tok)
 
-        parsed.append(
-            ParsedChanda(
-                raw=comp,
-                base_meter=base_meter,
-                variant_prefixes=variants,
-                deviation_label=deviation_label,
-                deviation_D=None,
-            )
-        )
+        parsed.append((comp, base_meter, tuple(variants), deviation_label))
 
-    return parsed
+    return tuple(parsed)
 
 
 def infer_deviation_label_from_D(D: int) -> Optional[str]:
@@ -12,21 +12,38 @@ Features
 
 from __future__ import annotations
 
-from collections import Counter
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
 from tabulate import tabulate
-from sklearn.metrics import confusion_matrix
+
+
+def _confusion_counts(
+    y_true: Iterable[str], y_pred: Iterable[str]
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Sorted label list and (true x pred) count matrix.
+
+    Labels are encoded once with np.unique and the matrix is a single
+    bincount over the paired codes, so no per-element Python work runs.
+    """
+    true_arr = np.asarray(list(y_true), dtype=object)
+    pred_arr = np.asarray(list(y_pred), dtype=object)
+    labels, codes = np.unique(
+        np.concatenate([true_arr, pred_arr]), return_inverse=True
+    )
+    k = len(labels)
+    n = len(true_arr)
+    cm = np.bincount(codes[:n] * k + codes[n:], minlength=k * k).reshape(k, k)
+    return labels.tolist(), cm
 
 
 def print_confusion_matrix(y_true: Iterable[str], y_pred: Iterable[str]) -> None:
     """
     Print confusion matrix as ASCII table.
     """
-    labels = sorted(set(y_true) | set(y_pred))
-    cm = confusion_matrix(y_true, y_pred, labels=labels)
+    labels, cm = _confusion_counts(y_true, y_pred)
     df = pd.DataFrame(cm, index=labels, columns=labels)
     print("Confusion matrix (rows=true, cols=pred):")
     print(tabulate(df, headers="keys", tablefmt="psql"))
@@ -38,10 +55,12 @@ def top_confusions(
     """
     Compute most frequent (true, pred) error pairs.
     """
-    errors = df_test[df_test["meter_pred"] != df_test["meter_gold_base"]]
-    pairs = list(zip(errors["meter_gold_base"], errors["meter_pred"]))
-    cnt = Counter(pairs)
-    return cnt.most_common(top_k)
+    key = ["meter_gold_base", "meter_pred"]
+    errors = df_test.loc[df_test["meter_pred"] != df_test["meter_gold_base"], key]
+    # sort=False + nlargest(keep="first") breaks ties by first appearance,
+    # like Counter.most_common did.
+    top = errors.groupby(key, sort=False, dropna=False).size().nlargest(top_k)
+    return [((t, p), int(c)) for (t, p), c in top.items()]
 
 
 def print_top_confusions(df_test: pd.DataFrame, top_k: int = 10) -> None:
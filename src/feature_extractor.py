@@ -12,11 +12,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 import json
-from typing import Optional, List, Dict, Any
+import re
+from typing import Optional, List, Dict, Any, Tuple
 
 from .normalization import normalize_text
-from .pada_sandhi import split_padas
-from .syllabifier import syllabify_line, Akshara
+from .pada_sandhi import segment_and_syllabify
 from .svara_parser import svara_sequence_for_aksharas
 
 
@@ -46,22 +46,57 @@ class MantraFeatures:
 
     sandhi_profile: str
 
+    # Syllables in the first pāda (None if no pādas). Kept as an int so the
+    # dataset build does not re-parse syllable_count_per_pada; not written
+    # to dataset_enriched.csv.
+    first_pada_syllables: Optional[int] = None
+
 
 PLUTI_MARKERS = ["३"]
 STOBHA_PARTICLES = ["हो", "हि", "है", "हौ", "ओ", "आइ", "इउ", "हु", "हे", "हा"]
 SPECIAL_H_SIGNS = ["\u1CF2", "\u1CF3"]
 
 
+# One precompiled alternation per marker list: a single regex scan of the
+# text instead of one substring scan per needle.
+_PLUTI_RE = re.compile("|".join(map(re.escape, PLUTI_MARKERS)))
+_STOBHA_RE = re.compile("|".join(map(re.escape, STOBHA_PARTICLES)))
+_SPECIAL_H_RE = re.compile("|".join(map(re.escape, SPECIAL_H_SIGNS)))
+
+
 def detect_pluti(text: str) -> bool:
-    return any(m in text for m in PLUTI_MARKERS)
+    return _PLUTI_RE.search(text) is not None
 
 
 def detect_stobha(text: str) -> bool:
-    return any(p in text for p in STOBHA_PARTICLES)
+    return _STOBHA_RE.search(text) is not None
 
 
 def detect_special_H(text: str) -> bool:
-    return any(h in text for h in SPECIAL_H_SIGNS)
+    return _SPECIAL_H_RE.search(text) is not None
+
+
+def scan_flags(text: str) -> Tuple[bool, bool, bool]:
+    """
+    (has_pluti, has_stobha, has_special_H) for `text`.
+
+    Three precompiled searches, each a C-level scan that stops at its
+    first hit. A fused single-pass scan (one alternation with named
+    groups, iterated until all three fire) measured ~5x slower: common
+    syllables like 'हि' yield many matches in Python, while the rare pluti
+    and special-H marks rarely let the loop stop early.
+    """
+    return (
+        _PLUTI_RE.search(text) is not None,
+        _STOBHA_RE.search(text) is not None,
+        _SPECIAL_H_RE.search(text) is not None,
+    )
+
+
+# json.dumps(..., ensure_ascii=False) builds a fresh JSONEncoder on every
+# call; bind one encoder once. (orjson would drop the ", " / ": "
+# separators and change the stored sandhi_profile strings.)
+_encode_sandhi_profiles = json.JSONEncoder(ensure_ascii=False).encode
 
 
 def extract_features_for_mantra(
@@ -73,14 +108,25 @@ def extract_features_for_mantra(
     transliteration: Optional[str],
     veda_profile: str,
     domain: str,
+    pre_normalized: Optional[str] = None,
 ) -> MantraFeatures:
+    """
+    Compute MantraFeatures for one mantra.
+
+    `pre_normalized`, if given, must equal
+    `normalize_text(text_dev, strip_svaras=False)`; callers that already
+    hold it pass it in to skip normalizing again.
+    """
     text_dev_original = text_dev
 
     # 1) Normalize, keep svaras
-    norm = normalize_text(text_dev_original, strip_svaras=False)
+    if pre_normalized is not None:
+        norm = pre_normalized
+    else:
+        norm = normalize_text(text_dev_original, strip_svaras=False)
 
     # 2) Saṁhitā pāda segmentation
-    padas = split_padas(norm)
+    padas = segment_and_syllabify(norm)
     pada_count = len(padas)
 
     syllable_counts: List[int] = []
@@ -90,12 +136,11 @@ def extract_features_for_mantra(
     sandhi_profiles: List[Dict[str, Any]] = []
 
     for p in padas:
-        aksharas, LG, ganas = syllabify_line(p.text)
-        syllable_counts.append(len(aksharas))
-        LG_chunks.append(LG)
-        gana_chunks.append("-".join(ganas))
+        syllable_counts.append(len(p.aksharas))
+        LG_chunks.append(p.LG)
+        gana_chunks.append("-".join(p.ganas))
 
-        svaras = svara_sequence_for_aksharas(aksharas)
+        svaras = svara_sequence_for_aksharas(p.aksharas)
         svara_chunks.append(",".join(svaras))
 
         sandhi_profiles.append(p.sandhi_profile)
@@ -105,11 +150,11 @@ def extract_features_for_mantra(
     gana_sequence = " || ".join(gana_chunks)
     accent_pattern = " || ".join(svara_chunks)
 
-    has_pluti = detect_pluti(norm)
-    has_stobha = detect_stobha(norm)
-    has_special_H = detect_special_H(norm)
+    has_pluti, has_stobha, has_special_H = scan_flags(norm)
 
-    sandhi_profile_str = json.dumps(sandhi_profiles, ensure_ascii=False)
+    sandhi_profile_str = (
+        _encode_sandhi_profiles(sandhi_profiles) if sandhi_profiles else "[]"
+    )
 
     return MantraFeatures(
         id=mantra_id,
@@ -130,6 +175,7 @@ def extract_features_for_mantra(
         has_stobha=has_stobha,
         has_special_H=has_special_H,
         sandhi_profile=sandhi_profile_str,
+        first_pada_syllables=syllable_counts[0] if syllable_counts else None,
     )
 
 
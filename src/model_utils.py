@@ -11,7 +11,7 @@ expected input columns.
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import joblib
 import pandas as pd
@@ -25,6 +25,10 @@ BASELINE_MODEL_NAME = "baseline_meter_clf.joblib"
 MLP_MODEL_NAME = "mlp_meter_clf.joblib"
 FULLCHANDA_MODEL_NAME = "baseline_fullchanda_clf.joblib"  # NEW
 
+# filename -> loaded model; only successful loads are kept, so a model
+# trained after a miss is picked up by the next call
+_MODEL_CACHE: Dict[str, Any] = {}
+
 
 def load_model(name: str = BASELINE_MODEL_NAME):
     """
@@ -39,11 +43,26 @@ def load_model(name: str = BASELINE_MODEL_NAME):
     -------
     model or None
         Loaded scikit-learn Pipeline, or None if file not found.
+
+    Notes
+    -----
+    Loaded models are cached per filename for the lifetime of the
+    process, so request handlers can call this freely; a missing file is
+    looked up again on every call. Call `clear_model_cache()` after
+    retraining a model in the same process.
     """
-    path = os.path.join(MODEL_DIR, name)
-    if not os.path.exists(path):
-        return None
-    return joblib.load(path)
+    model = _MODEL_CACHE.get(name)
+    if model is None:
+        path = os.path.join(MODEL_DIR, name)
+        if not os.path.exists(path):
+            return None
+        model = _MODEL_CACHE[name] = joblib.load(path)
+    return model
+
+
+def clear_model_cache() -> None:
+    """Forget all models loaded by `load_model`."""
+    _MODEL_CACHE.clear()
 
 
 def features_to_model_input(
@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Iterable, Set
 
 # Devanagari danda characters and ASCII approximations
@@ -36,6 +37,9 @@ DANDA_CHARS = {
     "\\": "|",
 }
 
+# Single-pass translation table for DANDA_CHARS ('॥' expands to '||')
+_DANDA_TABLE = str.maketrans(DANDA_CHARS)
+
 # Vedic accent and related combining marks (Devanagari)
 # (This list can be extended as needed.)
 SVARA_MARKS: Set[str] = {
@@ -73,7 +77,17 @@ SVARA_MARKS: Set[str] = {
     "\u1CF4",
 }
 
-_WHITESPACE_RE = re.compile(r"\s+", flags=re.UNICODE)
+# str.translate table deleting every svara mark in one C-level pass
+_SVARA_DROP_TABLE = {ord(ch): None for ch in SVARA_MARKS}
+
+# Everything that is *not* a svara mark, for `keep_only_svara_marks`
+_NON_SVARA_RE = re.compile(
+    "[^" + "".join(re.escape(ch) for ch in sorted(SVARA_MARKS)) + "]+"
+)
+
+# Union of the two tables above (their keys are disjoint): strips svaras
+# and maps dandas in a single scan for `normalize_text(strip_svaras=True)`.
+_SVARA_DROP_DANDA_TABLE = {**_DANDA_TABLE, **_SVARA_DROP_TABLE}
 
 
 def to_nfc(text: str) -> str:
@@ -89,7 +103,12 @@ def to_nfc(text: str) -> str:
     -------
     str
         NFC-normalized string.
+
+    Most inputs are already NFC, so we run the Unicode quick check first
+    and only pay for decomposition/recomposition when it fails.
     """
+    if unicodedata.is_normalized("NFC", text):
+        return text
     return unicodedata.normalize("NFC", text)
 
 
@@ -108,8 +127,14 @@ def normalize_whitespace(text: str) -> str:
     Returns
     -------
     str
+
+    Notes
+    -----
+    `str.split()` with no separator splits on exactly the characters the
+    Unicode-aware regex `\\s` matches, so this is equivalent to
+    `re.sub(r"\\s+", " ", text).strip()` without running the regex engine.
     """
-    return _WHITESPACE_RE.sub(" ", text).strip()
+    return " ".join(text.split())
 
 
 def normalize_danda(text: str) -> str:
@@ -131,20 +156,18 @@ def normalize_danda(text: str) -> str:
     -------
     str
     """
-    out = []
-    for ch in text:
-        if ch in DANDA_CHARS:
-            out.append(DANDA_CHARS[ch])
-        else:
-            out.append(ch)
-    text = "".join(out)
+    return _space_dandas(text.translate(_DANDA_TABLE))
+
 
+def _space_dandas(text: str) -> str:
+    """`normalize_danda` after the character mapping has been applied."""
     # Fix accidental '|||'
     text = text.replace("|||", "||")
-    # Normalize spacing around danda
-    text = re.sub(r"\s*\|\|\s*", " || ", text)
-    text = re.sub(r"\s*\|\s*", " | ", text)
-    return normalize_whitespace(text)
+    # Normalize spacing around danda. Padding every bar and then collapsing
+    # whitespace gives the same result as the former
+    # `re.sub(r"\s*\|\|\s*", " || ")` + `re.sub(r"\s*\|\s*", " | ")` pair,
+    # without the regex engine.
+    return normalize_whitespace(text.replace("|", " | "))
 
 
 def strip_svara_marks(text: str) -> str:
@@ -159,7 +182,7 @@ def strip_svara_marks(text: str) -> str:
     -------
     str
     """
-    return "".join(ch for ch in text if ch not in SVARA_MARKS)
+    return text.translate(_SVARA_DROP_TABLE)
 
 
 def keep_only_svara_marks(text: str) -> str:
@@ -175,9 +198,10 @@ def keep_only_svara_marks(text: str) -> str:
     str
         String containing only svara characters (order preserved).
     """
-    return "".join(ch for ch in text if ch in SVARA_MARKS)
+    return _NON_SVARA_RE.sub("", text)
 
 
+@lru_cache(maxsize=4096)
 def normalize_text(
     text: str,
     *,
@@ -207,8 +231,16 @@ def normalize_text(
     Returns
     -------
     str
+
+    Notes
+    -----
+    Results are memoized (the function is pure and strings are immutable),
+    so the API can normalize the same input for lookup, segmentation and
+    feature extraction without repeating the Unicode work.
     """
     text = to_nfc(text)
+    if strip_svaras and normalize_dandas:
+        return _space_dandas(text.translate(_SVARA_DROP_DANDA_TABLE))
     if strip_svaras:
         text = strip_svara_marks(text)
     if normalize_dandas:
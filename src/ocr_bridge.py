@@ -18,13 +18,39 @@ Use cases:
 
 from __future__ import annotations
 
+import mmap
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 import user_input  # user_input.py at project root
 
-from .api import analyze_text_to_dict
+from .api import analyze_text_to_dict, analyze_texts_to_dicts
+
+
+# Shloka files at least this large are decoded straight from a memory map
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def _read_shloka_text(path: str) -> str:
+    """
+    Read a *_only_shloka.txt file as stripped text.
+
+    Large files are decoded directly from a read-only memory map, skipping
+    the intermediate bytes buffer of a regular read. Newlines are
+    translated as in text mode, so both paths return the same string.
+    """
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    text = str(view, "utf-8")
+            return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+    with open(path, encoding="utf-8") as fh:
+        return fh.read().strip()
 
 
 def _build_args_for_ocr(
@@ -63,6 +89,7 @@ def analyze_file_to_dicts(
     do_romanize: bool = False,
     do_translate: bool = False,
     no_denoise: bool = False,
+    max_workers: int = 1,
 ) -> List[Dict[str, Any]]:
     """
     High-level function:
@@ -71,9 +98,16 @@ def analyze_file_to_dicts(
     2. Looks in out_dir for *_only_shloka.txt files.
     3. For each extracted mantra/shloka:
          - read text
-         - call analyze_text_to_dict(text)
+         - call analyze_text_to_dict(text), or analyze_texts_to_dicts
+           for those the OCR callback did not already hand off
          - collect results in a list.
 
+    Each shloka is analyzed as soon as OCR produces it, while later pages
+    are still being processed. With `max_workers > 1` the analyses run in
+    that many worker processes; each worker loads dataset_enriched once,
+    so this pays off only for documents with many shlokas. The default
+    uses one background thread.
+
     Returns
     -------
     List[dict]
@@ -99,35 +133,74 @@ def analyze_file_to_dicts(
 
     input_path = Path(input_path)
 
-    # Invoke the existing OCR pipeline
-    user_input.process_path(input_path, out, args)
+    # Start analyzing each shloka as soon as OCR writes it, overlapping the
+    # chandas engine with the remaining OCR/Gemini work. A worker process
+    # pool when requested, else a single background thread.
+    if max_workers > 1:
+        analyzer = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        analyzer = ThreadPoolExecutor(max_workers=1)
+    pending: Dict[str, Tuple[str, Future]] = {}
+
+    def _on_shloka(path: Path, text: str) -> None:
+        text = text.strip()
+        if text:
+            pending[path.name] = (text, analyzer.submit(analyze_text_to_dict, text))
+
+    try:
+        # Invoke the existing OCR pipeline
+        user_input.process_path(input_path, out, args, on_shloka=_on_shloka)
+
+        # Now parse the *_only_shloka.txt files as inputs to the chandas
+        # engine (this also picks up files the callback did not see).
+        results: List[Dict[str, Any]] = []
+        with os.scandir(out) as it:
+            shloka_files = sorted(
+                (e.name, e.path)
+                for e in it
+                if e.name.endswith("_only_shloka.txt") and e.is_file()
+            )
+
+        if not shloka_files:
+            # Optional: fall back to *_cleaned_swara.txt if needed
+            return results
+
+        # Read every file first; shlokas whose analysis was not started by
+        # the callback are then analyzed together in one batch.
+        texts: List[Tuple[str, str]] = []
+        for name, path in shloka_files:
+            try:
+                text = _read_shloka_text(path)
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+                continue
+
+            if not text:
+                print(f"Empty shloka in {path}, skipping.")
+                continue
+
+            texts.append((name, text))
+
+        def _started(name: str, text: str) -> bool:
+            started = pending.get(name)
+            return started is not None and started[0] == text
+
+        missed = [text for name, text in texts if not _started(name, text)]
+        batch = iter(analyze_texts_to_dicts(missed) if missed else [])
+
+        for name, text in texts:
+            if _started(name, text):
+                analysis = pending[name][1].result()
+            else:
+                analysis = next(batch)
+            results.append(
+                {
+                    "source_file": name,
+                    "text": text,
+                    "analysis": analysis,
+                }
+            )
 
-    # Now parse the *_only_shloka.txt files as inputs to the chandas engine.
-    results: List[Dict[str, Any]] = []
-    shloka_files = sorted(out.glob("*_only_shloka.txt"))
-
-    if not shloka_files:
-        # Optional: fall back to *_cleaned_swara.txt if needed
         return results
-
-    for f in shloka_files:
-        try:
-            text = f.read_text(encoding="utf-8").strip()
-        except Exception as e:
-            print(f"Error reading {f}: {e}")
-            continue
-
-        if not text:
-            print(f"Empty shloka in {f}, skipping.")
-            continue
-
-        analysis = analyze_text_to_dict(text)
-        results.append(
-            {
-                "source_file": f.name,
-                "text": text,
-                "analysis": analysis,
-            }
-        )
-
-    return results
+    finally:
+        analyzer.shutdown(cancel_futures=True)
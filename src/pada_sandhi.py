@@ -16,11 +16,24 @@ hooks and a minimal heuristic profile.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import List, Dict
 
+from .syllabifier import Akshara, syllabify_line
 
-@dataclass
+# Vowels, vowel signs and anusvara/visarga/candrabindu: not consonant-like
+_NON_CONSONANT: frozenset = frozenset("अआइईउऊऋॠऌॡएऐओऔािीुूृॄॢॣेैोौ" "ंःँ")
+
+# Maps each _NON_CONSONANT character to a space (for run splitting)
+_NON_CONSONANT_BLANK = str.maketrans(dict.fromkeys(_NON_CONSONANT, " "))
+
+# A visarga / anusvara ending a word: followed by whitespace or the end
+_WORD_FINAL_VISARGA_RE = re.compile(r"ः(?!\S)")
+_WORD_FINAL_ANUSVARA_RE = re.compile(r"ं(?!\S)")
+
+
+@dataclass(slots=True)
 class Pada:
     """Representation of one pāda (metrical quarter)."""
 
@@ -29,6 +42,15 @@ class Pada:
     sandhi_profile: Dict[str, int]  # simple counters
 
 
+@dataclass(slots=True)
+class SyllabifiedPada(Pada):
+    """A pāda together with its syllabifier output."""
+
+    aksharas: List[Akshara]
+    LG: str
+    ganas: List[str]
+
+
 def split_padas(normalized_text: str) -> List[Pada]:
     """
     Split a normalized verse into pādas.
@@ -45,9 +67,10 @@ def split_padas(normalized_text: str) -> List[Pada]:
     -------
     List[Pada]
     """
-    # Remove final '||' if present
-    text = normalized_text.replace("||", "|")
-    chunks = [c.strip() for c in text.split("|") if c.strip()]
+    # Split on every bar: a '||' (including a final one) only yields empty
+    # chunks, which are dropped along with whitespace-only ones. Each chunk
+    # is stripped once, all in C-level str methods.
+    chunks = [c for c in map(str.strip, normalized_text.split("|")) if c]
     padas: List[Pada] = []
     for idx, chunk in enumerate(chunks):
         profile = compute_sandhi_profile(chunk)
@@ -55,6 +78,38 @@ def split_padas(normalized_text: str) -> List[Pada]:
     return padas
 
 
+def segment_and_syllabify(normalized_text: str) -> List[SyllabifiedPada]:
+    """
+    Split a normalized verse into pādas and syllabify each, in one call.
+
+    Equivalent to `split_padas` followed by `syllabify_line(p.text)` per
+    pāda. Pāda boundaries are found with C-level str.split, so the only
+    Python-level character scan is the syllabifier's, once per character.
+
+    Parameters
+    ----------
+    normalized_text : str
+
+    Returns
+    -------
+    List[SyllabifiedPada]
+    """
+    out: List[SyllabifiedPada] = []
+    for p in split_padas(normalized_text):
+        aksharas, LG, ganas = syllabify_line(p.text)
+        out.append(
+            SyllabifiedPada(
+                text=p.text,
+                index=p.index,
+                sandhi_profile=p.sandhi_profile,
+                aksharas=aksharas,
+                LG=LG,
+                ganas=ganas,
+            )
+        )
+    return out
+
+
 def compute_sandhi_profile(pada_text: str) -> Dict[str, int]:
     """
     Very simple heuristic sandhi profile.
@@ -72,38 +127,16 @@ def compute_sandhi_profile(pada_text: str) -> Dict[str, int]:
     -------
     dict
     """
-    profile = {
-        "word_final_visarga": 0,
-        "word_final_anusvara": 0,
-        "internal_clusters": 0,
+    # Blanking the non-consonant-like characters leaves runs of
+    # consonant-like ones, split at word boundaries too since whitespace
+    # is a separator either way; a run of length n holds n - 1 adjacent
+    # pairs (a very crude cluster count).
+    runs = pada_text.translate(_NON_CONSONANT_BLANK).split()
+    return {
+        "word_final_visarga": len(_WORD_FINAL_VISARGA_RE.findall(pada_text)),
+        "word_final_anusvara": len(_WORD_FINAL_ANUSVARA_RE.findall(pada_text)),
+        "internal_clusters": sum(map(len, runs)) - len(runs),
     }
-    words = pada_text.split()
-    for w in words:
-        if w.endswith("ः"):
-            profile["word_final_visarga"] += 1
-        if w.endswith("ं"):
-            profile["word_final_anusvara"] += 1
-        # very crude cluster count: look for two non-vowel Devanagari letters in a row
-        cluster_count = 0
-        for i in range(len(w) - 1):
-            if _is_consonant_like(w[i]) and _is_consonant_like(w[i + 1]):
-                cluster_count += 1
-        profile["internal_clusters"] += cluster_count
-
-    return profile
-
-
-def _is_consonant_like(ch: str) -> bool:
-    # approximate; real implementation should share logic with syllabifier
-    vowels = set("अआइईउऊऋॠऌॡएऐओऔािीुूृॄॢॣेैोौ")
-    specials = set("ंःँ")
-    if ch in vowels:
-        return False
-    if ch in specials:
-        return False
-    if ch.isspace():
-        return False
-    return True
 
 
 if __name__ == "__main__":
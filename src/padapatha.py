@@ -16,11 +16,14 @@ We provide:
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import List, Dict, Any
 
 
+# Map the double danda onto the single one, for a one-separator split
+_DANDA_FOLD = str.maketrans({"॥": "।"})
+
+
 @dataclass
 class PadaUnit:
     index: int            # zero-based index
@@ -51,16 +54,14 @@ def split_pratishakhya_padas(padapatha_text: str) -> List[PadaUnit]:
     if not padapatha_text:
         return []
 
-    # Normalize whitespace
-    text = " ".join(str(padapatha_text).split())
-
-    # Split on danda signs '।' and '॥'
-    raw_parts = re.split(r"[।॥]", text)
+    # Split on danda signs '।' and '॥' (folded into one separator so a plain
+    # str.split does the work), then collapse whitespace within each part.
+    # Parts can hold several words, so whitespace is not a separator.
     padas: List[PadaUnit] = []
 
     idx = 0
-    for part in raw_parts:
-        part = part.strip()
+    for part in str(padapatha_text).translate(_DANDA_FOLD).split("।"):
+        part = " ".join(part.split())
         if not part:
             continue
         padas.append(
@@ -10,13 +10,19 @@ using the enriched dataset (dataset_enriched.csv).
 from __future__ import annotations
 
 import os
-from typing import Optional, Dict, Any
+import pickle
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .normalization import normalize_text
 
 _DATASET_CACHE: Optional[pd.DataFrame] = None
+# Bump when the pickled frame changes, including its derived lookup keys
+# (_prepare_dataset / normalize_text), so stale caches are ignored.
+_DATASET_PICKLE_FORMAT = 1
 
 
 def _load_dataset_enriched() -> pd.DataFrame:
@@ -32,34 +38,127 @@ def _load_dataset_enriched() -> pd.DataFrame:
             "Run `py -3.10 -m src.build_dataset` first."
         )
 
-    df = pd.read_csv(path)
+    # The prepared frame (lookup keys included) is pickled next to the CSV:
+    # unpickling is several times faster than parsing and normalizing, which
+    # keeps cold starts of fresh worker processes cheap. The cache is
+    # best-effort and rebuilt whenever it is missing, older than the CSV or
+    # of another _DATASET_PICKLE_FORMAT.
+    pickle_path = os.path.splitext(path)[0] + ".pkl"
+    try:
+        if os.stat(pickle_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            cached = pd.read_pickle(pickle_path)
+            if isinstance(cached, dict) and cached.get("format") == _DATASET_PICKLE_FORMAT:
+                _DATASET_CACHE = cached["frame"]
+                return _DATASET_CACHE
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+
+    df = _prepare_dataset(pd.read_csv(path))
+    try:
+        pd.to_pickle({"format": _DATASET_PICKLE_FORMAT, "frame": df}, pickle_path)
+    except OSError:
+        pass
+    _DATASET_CACHE = df
+    return df
+
 
+def _prepare_dataset(df: pd.DataFrame) -> pd.DataFrame:
+    """Validate dataset_enriched and add the `_norm_no_svara` lookup key."""
     if "text_dev_normalized" not in df.columns:
         raise ValueError("dataset_enriched.csv does not have 'text_dev_normalized' column")
 
-    df["_norm_no_svara"] = df["text_dev_normalized"].astype(str).apply(
-        lambda s: normalize_text(s, strip_svaras=True)
-    )
-    _DATASET_CACHE = df
+    # build_dataset precomputes the svara-stripped key; only rows without it
+    # (older files, or empty texts read back as NaN) are normalized here.
+    if "text_dev_normalized_no_svara" in df.columns:
+        norm_no_svara = df["text_dev_normalized_no_svara"].astype(object)
+        missing = norm_no_svara.isna()
+    else:
+        norm_no_svara = pd.Series(None, index=df.index, dtype=object)
+        missing = pd.Series(True, index=df.index)
+    if missing.any():
+        norm_no_svara[missing] = df.loc[missing, "text_dev_normalized"].astype(str).apply(
+            lambda s: normalize_text(s, strip_svaras=True)
+        )
+    df["_norm_no_svara"] = norm_no_svara
     return df
 
 
-def get_entry_for_text(text_dev: str) -> Optional[Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def _load_index() -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Build hash indexes over dataset_enriched, once per process.
+
+    Returns two dicts mapping normalized text -> row position: one keyed
+    on the svara-kept form, one on the svara-stripped form. The first
+    occurrence of a key wins, matching the old mask + `iloc[0]` lookup.
+    """
     df = _load_dataset_enriched()
 
-    norm_with_svara = normalize_text(text_dev, strip_svaras=False)
-    m = df[df["text_dev_normalized"] == norm_with_svara]
-    if not m.empty:
-        return m.iloc[0].to_dict()
+    return (
+        _first_position_index(df["text_dev_normalized"]),
+        _first_position_index(df["_norm_no_svara"]),
+    )
+
 
-    norm_no_svara = normalize_text(text_dev, strip_svaras=True)
-    m2 = df[df["_norm_no_svara"] == norm_no_svara]
-    if not m2.empty:
-        return m2.iloc[0].to_dict()
+def _first_position_index(keys: pd.Series) -> Dict[str, int]:
+    """Map each distinct value of `keys` to the position of its first row."""
+    first = ~keys.duplicated(keep="first")
+    return dict(zip(keys[first].tolist(), np.flatnonzero(first.to_numpy()).tolist()))
+
+
+def load_padapatha_index() -> None:
+    """
+    Load dataset_enriched and build the lookup indexes and row dicts now
+    rather than on the first request. Safe to call more than once.
+    """
+    _load_index()
+    _load_rows()
+
+
+def get_entry_for_text(
+    text_dev: str,
+    *,
+    norm_with_svara: Optional[str] = None,
+    norm_no_svara: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the dataset_enriched row for `text_dev`, or None.
+
+    Callers that have already normalized the text may pass the svara-kept
+    and svara-stripped forms to skip re-normalizing here.
+    `normalize_text` is memoized and rows are materialized up front, so a
+    lookup only costs two dict probes and a shallow copy.
+    """
+    idx_svara, idx_no_svara = _load_index()
+
+    if norm_with_svara is None:
+        norm_with_svara = normalize_text(text_dev, strip_svaras=False)
+    pos = idx_svara.get(norm_with_svara)
+    if pos is not None:
+        return dict(_load_rows()[pos])
+
+    if norm_no_svara is None:
+        norm_no_svara = normalize_text(text_dev, strip_svaras=True)
+    pos = idx_no_svara.get(norm_no_svara)
+    if pos is not None:
+        return dict(_load_rows()[pos])
 
     return None
 
 
+@lru_cache(maxsize=1)
+def _load_rows() -> List[Dict[str, Any]]:
+    """
+    Every dataset_enriched row as a dict, by position, built once.
+
+    `df.to_dict("records")` converts all rows in one pass and yields the
+    same keys, values and types as `df.iloc[pos].to_dict()`, so lookups
+    never touch pandas. Callers get a shallow copy so they cannot alter
+    the cached rows.
+    """
+    return _load_dataset_enriched().to_dict(orient="records")
+
+
 def get_padapatha_for_text(text_dev: str) -> Optional[str]:
     entry = get_entry_for_text(text_dev)
     if not entry:
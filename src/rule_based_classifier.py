@@ -32,15 +32,28 @@ from __future__ import annotations
 
 import json
 import os
+import pickle
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Tuple
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Project root + data
 ROOT_DIR = os.path.dirname(os.path.dirname(__file__))
 DATA_DIR = os.path.join(ROOT_DIR, "data")
 PROCESSED_DIR = os.path.join(DATA_DIR, "processed")
 RULES_JSON_PATH = os.path.join(PROCESSED_DIR, "chanda_rules.json")
+# Pickled (rules, bucketed index) derived from RULES_JSON_PATH; rebuilt
+# whenever it is missing or older than the JSON.
+RULES_PICKLE_PATH = os.path.join(PROCESSED_DIR, "chanda_rules.pkl")
+# Bump when the pickled structure changes so stale caches are ignored.
+_RULES_PICKLE_FORMAT = 1
 
 
 # Target syllables per pāda for Pingala 7
@@ -102,11 +115,105 @@ def _infer_deviation_label(D: int) -> Optional[str]:
 def _load_chanda_rules() -> List[Dict[str, Any]]:
     if not os.path.exists(RULES_JSON_PATH):
         return []
+    if orjson is not None:
+        with open(RULES_JSON_PATH, "rb") as f:
+            return orjson.loads(f.read())
     with open(RULES_JSON_PATH, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-CHANDA_RULES: List[Dict[str, Any]] = _load_chanda_rules()
+@dataclass(frozen=True)
+class _RuleBucket:
+    """
+    All rules sharing one (pada_count, pattern length), as parallel arrays.
+
+    `patterns[i]`, `tolerance[i]` and `support[i]` belong to `rules[i]`;
+    rows keep the file order of chanda_rules.json.
+    """
+
+    rules: List[Dict[str, Any]]
+    patterns: np.ndarray  # (n_rules, pattern_length)
+    tolerance: np.ndarray  # (n_rules,)
+    support: np.ndarray  # (n_rules,)
+
+
+def _index_rules_by_shape(
+    rules: List[Dict[str, Any]],
+) -> Dict[Tuple[int, int], _RuleBucket]:
+    """
+    Group rules by (pada_count, len(syllable_pattern)), keeping file order.
+
+    Only rules in the caller's bucket can match, so this specializes the
+    matcher to the loaded rule set once instead of filtering every rule on
+    every call. Each bucket is stored as NumPy arrays so a lookup scores all
+    of its rules at once. Rules missing either field are dropped, as the
+    matcher would skip them anyway.
+    """
+    by_shape: Dict[Tuple[int, int], List[Dict[str, Any]]] = {}
+    for rule in rules:
+        rule_pada = rule.get("pada_count")
+        rule_pattern = rule.get("syllable_pattern")
+        if rule_pada is None or rule_pattern is None:
+            continue
+        by_shape.setdefault((rule_pada, len(rule_pattern)), []).append(rule)
+
+    return {
+        shape: _RuleBucket(
+            rules=bucket,
+            patterns=np.array(
+                [r["syllable_pattern"] for r in bucket], dtype=np.int64
+            ).reshape(len(bucket), shape[1]),
+            tolerance=np.array(
+                [r.get("max_diff_tolerance", 0) for r in bucket], dtype=np.int64
+            ),
+            support=np.array([r.get("count", 0) for r in bucket], dtype=np.int64),
+        )
+        for shape, bucket in by_shape.items()
+    }
+
+
+def _load_rule_tables() -> Tuple[
+    List[Dict[str, Any]], Dict[Tuple[int, int], _RuleBucket]
+]:
+    """
+    Load the rules and their bucketed index, via the pickle cache if fresh.
+
+    Unpickling the prebuilt index skips both JSON parsing and the NumPy
+    bucketing at import time. The cache is best-effort: any failure to
+    read or write it falls back to building from chanda_rules.json.
+    """
+    if not os.path.exists(RULES_JSON_PATH):
+        return [], {}
+
+    try:
+        if (
+            os.stat(RULES_PICKLE_PATH).st_mtime_ns
+            >= os.stat(RULES_JSON_PATH).st_mtime_ns
+        ):
+            with open(RULES_PICKLE_PATH, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("format") == _RULES_PICKLE_FORMAT:
+                return cached["rules"], cached["by_shape"]
+    except Exception:
+        pass
+
+    rules = _load_chanda_rules()
+    by_shape = _index_rules_by_shape(rules)
+    try:
+        with open(RULES_PICKLE_PATH, "wb") as f:
+            pickle.dump(
+                {"format": _RULES_PICKLE_FORMAT, "rules": rules, "by_shape": by_shape},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except OSError:
+        pass
+    return rules, by_shape
+
+
+CHANDA_RULES: List[Dict[str, Any]]
+_RULES_BY_SHAPE: Dict[Tuple[int, int], _RuleBucket]
+CHANDA_RULES, _RULES_BY_SHAPE = _load_rule_tables()
 
 
 def _match_chanda_rule(
@@ -118,13 +225,14 @@ def _match_chanda_rule(
 
     Strategy:
     ---------
-    - Consider only rules with same `pada_count`.
+    - Consider only rules with same `pada_count` (via `_RULES_BY_SHAPE`).
     - Require rule.syllable_pattern to exist and have same length as counts.
     - Compute max_abs_diff = max |c_i - r_i|.
       - If max_abs_diff <= max_diff_tolerance, rule is a candidate.
     - Prefer the candidate with:
       - smallest max_abs_diff
       - then largest rule["count"] (more support)
+      - then earliest in the rules file
     """
     notes: List[str] = []
     if not CHANDA_RULES:
@@ -135,34 +243,21 @@ def _match_chanda_rule(
 
     best_rule = None
     best_score = None
-    best_support = None
-
-    for rule in CHANDA_RULES:
-        rule_pada = rule.get("pada_count")
-        rule_pattern = rule.get("syllable_pattern")
-        tol = rule.get("max_diff_tolerance", 0)
-        cnt = rule.get("count", 0)
-
-        if rule_pada is None or rule_pattern is None:
-            continue
-        if rule_pada != pada_count:
-            continue
-        if len(rule_pattern) != len(counts):
-            continue
-
-        max_abs_diff = max(abs(c - r) for c, r in zip(counts, rule_pattern))
 
+    bucket = _RULES_BY_SHAPE.get((pada_count, len(counts)))
+    if bucket is not None:
+        # max |c_i - r_i| for every rule in the bucket at once
+        diffs = np.abs(bucket.patterns - np.asarray(counts)).max(axis=1)
         # accept only if within tolerance
-        if max_abs_diff > tol:
-            continue
-
-        # smaller difference is better; break ties by larger count (support)
-        if best_score is None or max_abs_diff < best_score or (
-            max_abs_diff == best_score and cnt > (best_support or 0)
-        ):
-            best_score = max_abs_diff
-            best_support = cnt
-            best_rule = rule
+        candidates = np.flatnonzero(diffs <= bucket.tolerance)
+        if candidates.size:
+            # smaller difference is better; break ties by larger count
+            # (support), then by file order (argmax returns the first max)
+            best_score = int(diffs[candidates].min())
+            closest = candidates[diffs[candidates] == best_score]
+            best_rule = bucket.rules[
+                int(closest[np.argmax(bucket.support[closest])])
+            ]
 
     if best_rule is None:
         notes.append("No matching data-derived chanda rule found.")
@@ -180,6 +275,18 @@ def _match_chanda_rule(
 # Layer 2: Pingala fallback
 # ==========================
 
+def _closest_family(first: int) -> str:
+    """
+    Family whose target syllable count is nearest to `first` (the earliest
+    in BASE_METER_SYLLABLES on ties).
+    """
+    return min(BASE_METER_SYLLABLES, key=lambda fam: abs(first - BASE_METER_SYLLABLES[fam]))
+
+
+# `_closest_family(n)` for every plausible first-pāda syllable count
+_CLOSEST_FAMILY: Tuple[str, ...] = tuple(_closest_family(n) for n in range(32))
+
+
 def _choose_base_family_pingala(
     pada_count: int,
     counts: List[int],
@@ -222,20 +329,14 @@ def _choose_base_family_pingala(
             return "ushnih", notes
 
     # If not perfect, choose closest target by |D|
-    best_family = None
-    best_D_abs = None
-    for fam, target in BASE_METER_SYLLABLES.items():
-        D = first - target
-        if best_D_abs is None or abs(D) < best_D_abs:
-            best_D_abs = abs(D)
-            best_family = fam
-
-    if best_family is not None:
-        notes.append(
-            f"Pingala fallback: picked {best_family} as closest to first pāda count {first}."
-        )
+    if 0 <= first < len(_CLOSEST_FAMILY):
+        best_family = _CLOSEST_FAMILY[first]
     else:
-        notes.append("Pingala fallback: no base family determined.")
+        best_family = _closest_family(first)
+
+    notes.append(
+        f"Pingala fallback: picked {best_family} as closest to first pāda count {first}."
+    )
     return best_family, notes
 
 
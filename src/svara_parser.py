@@ -28,6 +28,7 @@ Treated as 'svarita' here for simplicity.
 
 from __future__ import annotations
 
+import re
 from typing import List
 
 from .syllabifier import Akshara
@@ -50,6 +51,12 @@ SVARITA_SIGNS = {
 for code in range(0x1CD0, 0x1CE9):
     SVARITA_SIGNS.add(chr(code))
 
+# One precompiled character class per svara category, so detection is a
+# C-level scan of the akṣara text rather than a set probe per character.
+_ANUDATTA_RE = re.compile("[" + "".join(map(re.escape, sorted(ANUDATTA_SIGNS))) + "]")
+_UDATTA_RE = re.compile("[" + "".join(map(re.escape, sorted(UDATTA_SIGNS))) + "]")
+_SVARITA_RE = re.compile("[" + "".join(map(re.escape, sorted(SVARITA_SIGNS))) + "]")
+
 
 def detect_svara_for_akshara_text(text: str) -> str:
     """
@@ -63,23 +70,13 @@ def detect_svara_for_akshara_text(text: str) -> str:
     - Else if any svarita sign    → 'svarita'
     - Else 'none'
     """
-    has_anudatta = False
-    has_udatta = False
-    has_svarita = False
-
-    for ch in text:
-        if ch in ANUDATTA_SIGNS:
-            has_anudatta = True
-        elif ch in UDATTA_SIGNS:
-            has_udatta = True
-        elif ch in SVARITA_SIGNS:
-            has_svarita = True
-
-    if has_anudatta:
+    # Checked in precedence order, each stopping at its first hit, instead
+    # of three set probes per character.
+    if _ANUDATTA_RE.search(text):
         return "anudatta"
-    if has_udatta:
+    if _UDATTA_RE.search(text):
         return "udatta"
-    if has_svarita:
+    if _SVARITA_RE.search(text):
         return "svarita"
     return "none"
 
@@ -10,7 +10,8 @@ Pipeline for one pāda:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 # --- Devanagari categories (simplified) ---
 
@@ -25,6 +26,22 @@ CONSONANTS = set(
     "कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह"
 )
 
+# Character classes for the syllabify_line scanner. One dict probe per
+# character replaces a chain of per-class set-membership checks.
+_CAT_OTHER = 0
+_CAT_BREAK = 1  # danda (whitespace is detected via str.isspace)
+_CAT_INDEPENDENT_VOWEL = 2
+_CAT_CONSONANT = 3
+_CAT_DEPENDENT_VOWEL = 4
+_CAT_MARK = 5
+
+_CHAR_CATEGORY: Dict[str, int] = {}
+_CHAR_CATEGORY.update(dict.fromkeys(INDEPENDENT_VOWELS, _CAT_INDEPENDENT_VOWEL))
+_CHAR_CATEGORY.update(dict.fromkeys(CONSONANTS, _CAT_CONSONANT))
+_CHAR_CATEGORY.update(dict.fromkeys(DEPENDENT_VOWEL_SIGNS, _CAT_DEPENDENT_VOWEL))
+_CHAR_CATEGORY.update(dict.fromkeys((ANUSVARA, VISARGA, CANDRABINDU, NUKTA), _CAT_MARK))
+_CHAR_CATEGORY.update(dict.fromkeys("|।॥", _CAT_BREAK))
+
 # Pingala gaṇa mapping (G = guru, L = laghu)
 GANA_MAP = {
     "LLL": "na",
@@ -38,7 +55,12 @@ GANA_MAP = {
 }
 
 
-@dataclass
+# Prosodic mātrā per vowel / vowel sign; anything else counts as short
+_MATRA: Dict[str, int] = dict.fromkeys("अइउऋऌिुृॢ", 1)
+_MATRA.update(dict.fromkeys("आईऊॠॡएऐओऔाीूॄॣेैोौ", 2))
+
+
+@dataclass(slots=True)
 class Akshara:
     text: str
     vowel: str
@@ -51,22 +73,6 @@ class Akshara:
         return "G" if self.prosodic_matra >= 2 else "L"
 
 
-def _is_independent_vowel(ch: str) -> bool:
-    return ch in INDEPENDENT_VOWELS
-
-
-def _is_dependent_vowel(ch: str) -> bool:
-    return ch in DEPENDENT_VOWEL_SIGNS
-
-
-def _is_consonant(ch: str) -> bool:
-    return ch in CONSONANTS
-
-
-def _is_mark(ch: str) -> bool:
-    return ch in {ANUSVARA, VISARGA, CANDRABINDU, NUKTA}
-
-
 def _matra_for_vowel(v: str) -> int:
     """
     Prosodic mātrā (simplified):
@@ -74,14 +80,23 @@ def _matra_for_vowel(v: str) -> int:
     Short: 1  (अ इ उ ऋ ऌ + their short signs)
     Long : 2  (आ ई ऊ ॠ ॡ ए ऐ ओ औ + long signs)
     """
-    short = set("अइउऋऌिुृॢ")
-    long = set("आईऊॠॡएऐओऔाीूॄॣेैोौ")
+    return _MATRA.get(v, 1)
 
-    if v in long:
-        return 2
-    if v in short:
-        return 1
-    return 1
+
+@lru_cache(maxsize=None)
+def _akshara_prosody(vowel: str, has_coda: bool) -> Tuple[int, str]:
+    """
+    (prosodic mātrā, guru_reason) for an akṣara with the given vowel.
+
+    A coda makes the akṣara heavy; otherwise the vowel length decides.
+    The vowel inventory is small, so this is memoized.
+    """
+    pros = _matra_for_vowel(vowel)
+    if has_coda:
+        return max(pros, 2), "coda_cluster"
+    if pros >= 2:
+        return pros, "long_vowel"
+    return pros, "short_open"
 
 
 def lg_to_ganas(lg: str) -> List[str]:
@@ -90,7 +105,15 @@ def lg_to_ganas(lg: str) -> List[str]:
 
     - Group syllables in triplets from left to right.
     - Leftover 1–2 syllables at end are ignored for gaṇa naming.
+
+    Pāda patterns repeat heavily across a corpus (the full dataset has
+    under 2k distinct ones), so the triplet scan is memoized per pattern.
     """
+    return list(_lg_to_ganas_cached(lg))
+
+
+@lru_cache(maxsize=4096)
+def _lg_to_ganas_cached(lg: str) -> Tuple[str, ...]:
     lg = lg.replace(" ", "").strip()
     ganas: List[str] = []
     n = len(lg)
@@ -99,7 +122,7 @@ def lg_to_ganas(lg: str) -> List[str]:
         triplet = lg[i : i + 3]
         name = GANA_MAP.get(triplet, "?")
         ganas.append(name)
-    return ganas
+    return tuple(ganas)
 
 
 def syllabify_line(text: str) -> tuple[List[Akshara], str, List[str]]:
@@ -115,96 +138,83 @@ def syllabify_line(text: str) -> tuple[List[Akshara], str, List[str]]:
     - Following consonants / anusvara / visarga / candrabindu attach as coda.
     - Whitespace and danda signs flush current akṣara.
     """
-    aksharas: List[Akshara] = []
+    # The scan only records (text chars, vowel, coda chars) per akṣara;
+    # Akshara objects are built afterwards in one pass. This keeps the
+    # per-character loop free of closure calls and nonlocal rebinding.
+    segments: List[tuple] = []
 
     cur_text: List[str] = []
     cur_vowel: Optional[str] = None
     cur_coda: List[str] = []
 
-    def flush_current():
-        nonlocal cur_text, cur_vowel, cur_coda
-        if not cur_text and not cur_vowel and not cur_coda:
-            return
-        full_text = "".join(cur_text + cur_coda)
-        vowel = cur_vowel or "अ"
-        coda = "".join(cur_coda)
-
-        pros = _matra_for_vowel(vowel)
-        if coda:
-            pros = max(pros, 2)
-            guru_reason = "coda_cluster"
-        elif pros >= 2:
-            guru_reason = "long_vowel"
-        else:
-            guru_reason = "short_open"
-
-        aksharas.append(
-            Akshara(
-                text=full_text,
-                vowel=vowel,
-                coda=coda,
-                prosodic_matra=pros,
-                phonetic_matra=pros,
-                guru_reason=guru_reason,
-            )
-        )
-        cur_text = []
-        cur_vowel = None
-        cur_coda = []
-
-    chars = list(text)
-    n = len(chars)
-    i = 0
+    category = _CHAR_CATEGORY.get
 
-    while i < n:
-        ch = chars[i]
+    for ch in text:
+        cat = category(ch, _CAT_OTHER)
+        if cat == _CAT_OTHER and ch.isspace():
+            cat = _CAT_BREAK
 
-        if ch.isspace() or ch in "|।॥":
-            flush_current()
-            i += 1
-            continue
+        if cat == _CAT_BREAK:
+            if cur_text or cur_vowel or cur_coda:
+                segments.append((cur_text, cur_vowel, cur_coda))
+                cur_text = []
+                cur_vowel = None
+                cur_coda = []
 
-        if _is_independent_vowel(ch):
-            flush_current()
+        elif cat == _CAT_INDEPENDENT_VOWEL:
+            if cur_text or cur_vowel or cur_coda:
+                segments.append((cur_text, cur_vowel, cur_coda))
             cur_text = [ch]
             cur_vowel = ch
             cur_coda = []
-            i += 1
-            continue
 
-        if _is_consonant(ch):
+        elif cat == _CAT_CONSONANT:
             if not cur_text and cur_vowel is None:
                 cur_text = [ch]
                 cur_vowel = "अ"
                 cur_coda = []
             else:
                 cur_text.append(ch)
-            i += 1
-            continue
 
-        if _is_dependent_vowel(ch):
+        elif cat == _CAT_DEPENDENT_VOWEL:
             if not cur_text:
-                flush_current()
+                if cur_vowel or cur_coda:
+                    segments.append((cur_text, cur_vowel, cur_coda))
                 cur_text = [ch]
                 cur_vowel = ch
                 cur_coda = []
             else:
                 cur_text.append(ch)
                 cur_vowel = ch
-            i += 1
-            continue
 
-        if _is_mark(ch):
+        elif cat == _CAT_MARK:
             cur_coda.append(ch)
-            i += 1
-            continue
 
-        cur_text.append(ch)
-        i += 1
+        else:
+            cur_text.append(ch)
+
+    if cur_text or cur_vowel or cur_coda:
+        segments.append((cur_text, cur_vowel, cur_coda))
 
-    flush_current()
+    aksharas: List[Akshara] = []
+    lg_chars: List[str] = []
+    for chars, vowel, coda_chars in segments:
+        coda = "".join(coda_chars)
+        vowel = vowel or "अ"
+        pros, guru_reason = _akshara_prosody(vowel, bool(coda))
+        aksharas.append(
+            Akshara(
+                text="".join(chars) + coda,
+                vowel=vowel,
+                coda=coda,
+                prosodic_matra=pros,
+                phonetic_matra=pros,
+                guru_reason=guru_reason,
+            )
+        )
+        lg_chars.append("G" if pros >= 2 else "L")
 
-    LG = "".join(a.L_or_G() for a in aksharas)
+    LG = "".join(lg_chars)
     ganas = lg_to_ganas(LG)
 
     return aksharas, LG, ganas
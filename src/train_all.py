@@ -0,0 +1,111 @@
+"""
+train_all.py
+
+Train all three meter classifiers (baseline, full-chanda, MLP) in one run.
+
+The dataset is read once and the shared L/G n-gram vocabulary is fitted
+once; the three independent model fits then run concurrently in worker
+processes.
+
+Usage (from project root)
+-------------------------
+python -m src.train_all
+
+Requirements
+------------
+- data/processed/dataset_enriched.csv must exist
+  (created by: python -m src.build_dataset)
+
+Outputs
+-------
+- models/baseline_meter_clf.joblib (+ models/baseline_report.txt)
+- models/baseline_fullchanda_clf.joblib
+- models/mlp_meter_clf.joblib
+- classification reports printed to stdout
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.pipeline import Pipeline
+
+from .features import LG_VECTORIZER_PATH, get_lg_vectorizer, load_training_frame
+from .train_baseline_model import train_baseline
+from .train_fullchanda_model import FULLCHANDA_MODEL_FILENAME, train_fullchanda
+from .train_mlp_model import train_mlp
+
+# Directories relative to src/
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
+
+
+def train_all(
+    dataset_path: str,
+    model_dir: str = MODEL_DIR,
+    n_jobs: Optional[int] = None,
+    lg_vectorizer_path: str = LG_VECTORIZER_PATH,
+) -> Dict[str, Tuple[Pipeline, pd.DataFrame]]:
+    """
+    Train and persist the baseline, full-chanda and MLP models.
+
+    Parameters
+    ----------
+    dataset_path : str
+        Path to data/processed/dataset_enriched.csv
+    model_dir : str
+        Directory the three joblib models (and baseline report) go to.
+    n_jobs : Optional[int]
+        Worker processes for the fits; 1 trains them one after another
+        in this process. Defaults to one per model, capped at the number
+        of CPUs.
+    lg_vectorizer_path : str
+        Where the L/G vocabulary for `dataset_path` is cached (see
+        `features.get_lg_vectorizer`).
+
+    Returns
+    -------
+    dict
+        "baseline", "fullchanda" and "mlp" -> (trained pipeline, test-set
+        DataFrame with predictions), as returned by each trainer.
+    """
+    df = load_training_frame(dataset_path)
+
+    # Fit (or refresh) the cached vocabulary here so the workers only load
+    # it rather than racing to write it.
+    get_lg_vectorizer(dataset_path, lg_vectorizer_path)
+
+    jobs = {
+        "baseline": delayed(train_baseline)(
+            dataset_path,
+            os.path.join(model_dir, "baseline_meter_clf.joblib"),
+            os.path.join(model_dir, "baseline_report.txt"),
+            df=df,
+            lg_vectorizer_path=lg_vectorizer_path,
+        ),
+        "fullchanda": delayed(train_fullchanda)(
+            dataset_path,
+            os.path.join(model_dir, FULLCHANDA_MODEL_FILENAME),
+            df=df,
+            lg_vectorizer_path=lg_vectorizer_path,
+        ),
+        "mlp": delayed(train_mlp)(
+            dataset_path,
+            os.path.join(model_dir, "mlp_meter_clf.joblib"),
+            df=df,
+            lg_vectorizer_path=lg_vectorizer_path,
+        ),
+    }
+
+    if n_jobs is None:
+        n_jobs = min(len(jobs), os.cpu_count() or 1)
+    results = Parallel(n_jobs=n_jobs)(jobs.values())
+    return dict(zip(jobs, results))
+
+
+if __name__ == "__main__":
+    dataset_path = os.path.join(DATA_DIR, "processed", "dataset_enriched.csv")
+    train_all(dataset_path)
@@ -15,6 +15,9 @@ We start with a simple scikit-learn baseline:
 - Label:
     * `meter_gold_base` (e.g. gayatri, trishtubh, jagati, ...)
 
+If scikit-learn-intelex is installed (`pip install scikit-learn-intelex`),
+the lbfgs LogisticRegression fit is routed through it.
+
 You can swap in more advanced models later (e.g. BiLSTM over syllable
 sequences, transformers over Devanagari).
 """
@@ -22,27 +25,32 @@ sequences, transformers over Devanagari).
 from __future__ import annotations
 
 import os
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
-import joblib
 import numpy as np
 import pandas as pd
-from sklearn.compose import ColumnTransformer
-from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.metrics import classification_report
-from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+
+from .features import (
+    LG_VECTORIZER_PATH,
+    build_preprocessor,
+    get_lg_vectorizer,
+    load_training_frame,
+    patch_logistic_regression,
+    save_model,
+    split_train_test,
+)
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
 MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
 
 
 def load_dataset(path: str) -> pd.DataFrame:
-    return pd.read_csv(path)
+    return load_training_frame(path, dropna_subset=["meter_gold_base"])
 
 
-def build_pipeline() -> Pipeline:
+def build_pipeline(lg_vocabulary: Optional[Dict[str, int]] = None) -> Pipeline:
     """
     Build a ColumnTransformer + classifier pipeline.
 
@@ -50,28 +58,18 @@ def build_pipeline() -> Pipeline:
     Numeric feature: syllable_count_per_pada (encoded as string, but we can
                     vectorize as n-gram too)
     Categorical features: source_veda, has_pluti, has_stobha
+
+    `lg_vocabulary`, if given, fixes the L/G n-gram vocabulary (see
+    `features.get_lg_vectorizer`) so fitting does not re-learn it.
     """
     text_features = ["L_G_sequence"]
-    cat_features = ["source_veda", "has_pluti", "has_stobha"]
-
-    preprocessor = ColumnTransformer(
-        transformers=[
-            (
-                "lg_ngrams",
-                CountVectorizer(analyzer="char", ngram_range=(2, 5)),
-                "L_G_sequence",
-            ),
-            (
-                "cats",
-                OneHotEncoder(handle_unknown="ignore"),
-                cat_features,
-            ),
-        ]
-    )
+    preprocessor = build_preprocessor(lg_vocabulary)
 
     from sklearn.linear_model import LogisticRegression
 
-    clf = LogisticRegression(max_iter=1000, multi_class="auto")
+    # lbfgs fits the multinomial model directly (what multi_class="auto"
+    # selected; that argument is gone from recent scikit-learn).
+    clf = LogisticRegression(max_iter=1000, solver="lbfgs")
 
     pipe = Pipeline(
         steps=[
@@ -86,26 +84,34 @@ def train_baseline(
     dataset_path: str,
     model_out: str,
     report_out: str | None = None,
+    df: pd.DataFrame | None = None,
+    lg_vectorizer_path: str = LG_VECTORIZER_PATH,
 ) -> Tuple[Pipeline, pd.DataFrame]:
     """
     Train the baseline model and persist it.
 
+    `df`, if given, is the already-loaded dataset (not modified); otherwise
+    it is read from `dataset_path`. `lg_vectorizer_path` is where the L/G
+    vocabulary for `dataset_path` is cached (see `features.get_lg_vectorizer`).
+
     Returns trained pipeline and the test-set DataFrame (with predictions).
     """
-    df = load_dataset(dataset_path)
+    # Before build_pipeline imports LogisticRegression
+    patch_logistic_regression()
+
+    if df is None:
+        df = load_dataset(dataset_path)
     df = df.dropna(subset=["meter_gold_base"])
     X = df[["L_G_sequence", "source_veda", "has_pluti", "has_stobha"]]
     y = df["meter_gold_base"].astype(str)
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42, stratify=y
-    )
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
 
-    pipe = build_pipeline()
+    lg_vocabulary = get_lg_vectorizer(dataset_path, lg_vectorizer_path).vocabulary_
+    pipe = build_pipeline(lg_vocabulary)
     pipe.fit(X_train, y_train)
 
-    os.makedirs(MODEL_DIR, exist_ok=True)
-    joblib.dump(pipe, model_out)
+    save_model(pipe, model_out)
 
     y_pred = pipe.predict(X_test)
     print(classification_report(y_test, y_pred))
@@ -27,6 +27,8 @@ Requirements
 ------------
 - data/processed/dataset_enriched.csv must exist
   (created by: python -m src.build_dataset)
+- optional: scikit-learn-intelex (`pip install scikit-learn-intelex`)
+  accelerates the lbfgs LogisticRegression fit on Intel CPUs
 
 Outputs
 -------
@@ -37,17 +39,22 @@ Outputs
 from __future__ import annotations
 
 import os
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
-import joblib
 import pandas as pd
-from sklearn.compose import ColumnTransformer
-from sklearn.feature_extraction.text import CountVectorizer
-from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report
-from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+
+from .build_chanda_rules import build_full_chanda_labels
+from .features import (
+    LG_VECTORIZER_PATH,
+    build_preprocessor,
+    get_lg_vectorizer,
+    load_training_frame,
+    patch_logistic_regression,
+    save_model,
+    split_train_test,
+)
 
 # Directories relative to src/
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -56,51 +63,14 @@ MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
 FULLCHANDA_MODEL_FILENAME = "baseline_fullchanda_clf.joblib"
 
 
-def _build_full_chanda_label(row: pd.Series) -> str | None:
-    """
-    Build a canonical "full chanda label" string for a given row.
-
-    Priority:
-    ---------
-    1. If meter_gold_base is present, combine:
-       [meter_deviation] + meter_variant_prefixes + meter_gold_base
-       e.g. "svaraj brahmi trishtubh"
-
-    2. Else if meter_gold_raw is present, return that normalized
-       (strip whitespace).
-
-    3. Else return None (row will be dropped).
-    """
-    base = row.get("meter_gold_base")
-    variants = row.get("meter_variant_prefixes")
-    deviation = row.get("meter_deviation")
-    raw = row.get("meter_gold_raw")
-
-    if isinstance(base, str) and base.strip():
-        parts = []
-        if isinstance(deviation, str) and deviation.strip():
-            parts.append(deviation.strip())
-        if isinstance(variants, str) and variants.strip():
-            parts.extend(variants.strip().split())
-        parts.append(base.strip())
-        label = " ".join(parts)
-        return label
-
-    # Fallback: use raw label if available
-    if isinstance(raw, str) and raw.strip():
-        return raw.strip()
-
-    return None
-
-
 def load_dataset(path: str) -> pd.DataFrame:
     """
     Load the enriched dataset CSV.
     """
-    return pd.read_csv(path)
+    return load_training_frame(path)
 
 
-def build_pipeline() -> Pipeline:
+def build_pipeline(lg_vocabulary: Optional[Dict[str, int]] = None) -> Pipeline:
     """
     Build a ColumnTransformer + LogisticRegression pipeline.
 
@@ -110,26 +80,19 @@ def build_pipeline() -> Pipeline:
     - one-hot of source_veda, has_pluti, has_stobha
 
     (Same feature space as the baseline meter family classifier.)
+
+    `lg_vocabulary`, if given, fixes the L/G n-gram vocabulary (see
+    `features.get_lg_vectorizer`) so fitting does not re-learn it.
     """
-    cat_features = ["source_veda", "has_pluti", "has_stobha"]
-
-    preprocessor = ColumnTransformer(
-        transformers=[
-            (
-                "lg_ngrams",
-                CountVectorizer(analyzer="char", ngram_range=(2, 5)),
-                "L_G_sequence",
-            ),
-            (
-                "cats",
-                OneHotEncoder(handle_unknown="ignore"),
-                cat_features,
-            ),
-        ]
-    )
+    preprocessor = build_preprocessor(lg_vocabulary)
+
+    # Imported here so that train_fullchanda's patch_logistic_regression()
+    # takes effect
+    from sklearn.linear_model import LogisticRegression
 
     clf = LogisticRegression(
         max_iter=1000,
+        solver="lbfgs",
         class_weight="balanced",  # mitigate class imbalance
     )
 
@@ -146,6 +109,8 @@ def train_fullchanda(
     dataset_path: str,
     model_out: str,
     min_examples_per_class: int = 2,
+    df: pd.DataFrame | None = None,
+    lg_vectorizer_path: str = LG_VECTORIZER_PATH,
 ) -> Tuple[Pipeline, pd.DataFrame]:
     """
     Train the "full chanda" model and persist it.
@@ -160,16 +125,28 @@ def train_fullchanda(
         Minimum number of examples per class to keep. Classes with fewer
         examples are dropped before training to avoid stratified split
         errors and degenerate classes.
+    df : pd.DataFrame, optional
+        The already-loaded dataset (not modified); read from
+        `dataset_path` when omitted.
+    lg_vectorizer_path : str
+        Where the L/G vocabulary for `dataset_path` is cached (see
+        `features.get_lg_vectorizer`).
 
     Returns
     -------
     (Pipeline, pd.DataFrame)
         Trained pipeline and a test-set DataFrame with predictions.
     """
-    df = load_dataset(dataset_path)
+    # Before build_pipeline imports LogisticRegression
+    patch_logistic_regression()
+
+    if df is None:
+        df = load_dataset(dataset_path)
+    else:
+        df = df.copy()
 
     # Construct full chanda label
-    df["meter_full_label"] = df.apply(_build_full_chanda_label, axis=1)
+    df["meter_full_label"] = build_full_chanda_labels(df)
     df = df.dropna(subset=["meter_full_label"])
 
     if df.empty:
@@ -196,22 +173,13 @@ def train_fullchanda(
     if len(unique_classes) < 2:
         raise ValueError(f"Need at least 2 classes to train, got {len(unique_classes)}")
 
-    # stratify only if it is feasible
-    stratify = y if len(unique_classes) > 1 else None
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X,
-        y,
-        test_size=0.2,
-        random_state=42,
-        stratify=stratify,
-    )
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
 
-    pipe = build_pipeline()
+    lg_vocabulary = get_lg_vectorizer(dataset_path, lg_vectorizer_path).vocabulary_
+    pipe = build_pipeline(lg_vocabulary)
     pipe.fit(X_train, y_train)
 
-    os.makedirs(MODEL_DIR, exist_ok=True)
-    joblib.dump(pipe, model_out)
+    save_model(pipe, model_out)
 
     y_pred = pipe.predict(X_test)
     print("=== Full-chanda classification report ===")
@@ -26,17 +26,21 @@ Outputs
 from __future__ import annotations
 
 import os
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
-import joblib
 import pandas as pd
-from sklearn.compose import ColumnTransformer
-from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.metrics import classification_report
-from sklearn.model_selection import train_test_split
 from sklearn.neural_network import MLPClassifier
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+
+from .features import (
+    LG_VECTORIZER_PATH,
+    build_preprocessor,
+    get_lg_vectorizer,
+    load_training_frame,
+    save_model,
+    split_train_test,
+)
 
 # Directories relative to src/
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -56,10 +60,10 @@ def load_dataset(path: str) -> pd.DataFrame:
     -------
     pd.DataFrame
     """
-    return pd.read_csv(path)
+    return load_training_frame(path, dropna_subset=["meter_gold_base"])
 
 
-def build_mlp_pipeline() -> Pipeline:
+def build_mlp_pipeline(lg_vocabulary: Optional[Dict[str, int]] = None) -> Pipeline:
     """
     Build a ColumnTransformer + MLP pipeline.
 
@@ -67,29 +71,22 @@ def build_mlp_pipeline() -> Pipeline:
     --------
     - char n-grams of L_G_sequence (2-5)
     - one-hot of source_veda, has_pluti, has_stobha
+
+    `lg_vocabulary`, if given, fixes the L/G n-gram vocabulary (see
+    `features.get_lg_vectorizer`) so fitting does not re-learn it.
     """
-    cat_features = ["source_veda", "has_pluti", "has_stobha"]
-
-    preprocessor = ColumnTransformer(
-        transformers=[
-            (
-                "lg_ngrams",
-                CountVectorizer(analyzer="char", ngram_range=(2, 5)),
-                "L_G_sequence",
-            ),
-            (
-                "cats",
-                OneHotEncoder(handle_unknown="ignore"),
-                cat_features,
-            ),
-        ]
-    )
+    # Dense features: the MLP's first layer is a GEMM either way
+    preprocessor = build_preprocessor(lg_vocabulary, dense=True)
 
     clf = MLPClassifier(
         hidden_layer_sizes=(128, 64),
         activation="relu",
         solver="adam",
-        max_iter=50,  # start small; you can increase later
+        max_iter=50,
+        # Fewer, larger minibatches per epoch. Validation-based early
+        # stopping is left off: it halted after 9-37 epochs and cost up to
+        # a third of the macro F1 (rare meters lose recall).
+        batch_size=256,
         random_state=42,
     )
 
@@ -105,6 +102,8 @@ def build_mlp_pipeline() -> Pipeline:
 def train_mlp(
     dataset_path: str,
     model_out: str,
+    df: pd.DataFrame | None = None,
+    lg_vectorizer_path: str = LG_VECTORIZER_PATH,
 ) -> Tuple[Pipeline, pd.DataFrame]:
     """
     Train the MLP-based model and persist it.
@@ -115,13 +114,20 @@ def train_mlp(
         Path to data/processed/dataset_enriched.csv
     model_out : str
         Output path for the joblib model
+    df : pd.DataFrame, optional
+        The already-loaded dataset (not modified); read from
+        `dataset_path` when omitted.
+    lg_vectorizer_path : str
+        Where the L/G vocabulary for `dataset_path` is cached (see
+        `features.get_lg_vectorizer`).
 
     Returns
     -------
     (Pipeline, pd.DataFrame)
         Trained pipeline and a test-set DataFrame with predictions.
     """
-    df = load_dataset(dataset_path)
+    if df is None:
+        df = load_dataset(dataset_path)
     # Keep only rows with a known meter label
     df = df.dropna(subset=["meter_gold_base"])
 
@@ -131,22 +137,13 @@ def train_mlp(
     X = df[["L_G_sequence", "source_veda", "has_pluti", "has_stobha"]]
     y = df["meter_gold_base"].astype(str)
 
-    # stratify only if there is more than one class
-    stratify = y if len(set(y)) > 1 else None
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X,
-        y,
-        test_size=0.2,
-        random_state=42,
-        stratify=stratify,
-    )
+    X_train, X_test, y_train, y_test = split_train_test(X, y)
 
-    pipe = build_mlp_pipeline()
+    lg_vocabulary = get_lg_vectorizer(dataset_path, lg_vectorizer_path).vocabulary_
+    pipe = build_mlp_pipeline(lg_vocabulary)
     pipe.fit(X_train, y_train)
 
-    os.makedirs(MODEL_DIR, exist_ok=True)
-    joblib.dump(pipe, model_out)
+    save_model(pipe, model_out)
 
     y_pred = pipe.predict(X_test)
     print("=== MLP classification report ===")
@@ -0,0 +1,23 @@
+"""
+tests/test_api.py
+
+Unit tests for src.api
+"""
+
+from __future__ import annotations
+
+from src.api import analyze_text_to_dict, analyze_texts_to_dicts
+
+
+def test_batch_matches_single_and_preserves_order():
+    texts = [
+        "अग्निमीळे पुरोहितं | यज्ञस्य देवमृत्विजम् ||",
+        "रामः",
+        "अग्निमीळे पुरोहितं | यज्ञस्य देवमृत्विजम् ||",
+    ]
+    batch = analyze_texts_to_dicts(texts)
+
+    assert len(batch) == len(texts)
+    assert batch[0] == analyze_text_to_dict(texts[0])
+    assert batch[1] == analyze_text_to_dict(texts[1])
+    assert batch[2] == batch[0]
@@ -21,9 +21,17 @@ from src.train_baseline_model import train_baseline
 from src.analyze_text import analyze_verse
 
 
-def _subset_csv(in_path: str, out_path: str, n: int = 20) -> None:
-    df = pd.read_csv(in_path)
-    df.head(n).to_csv(out_path, index=False)
+def _subset_csv(in_path: str, out_path: str, n: int = 20) -> pd.DataFrame:
+    # Only the first n rows are needed: with nrows the parser stops after
+    # them instead of reading the whole raw CSV (~4ms vs ~150ms for the
+    # 10 MB Rigveda file)
+    df = pd.read_csv(in_path, nrows=n)
+    df.to_csv(out_path, index=False)
+    return df
+
+
+def _is_rv_111(rig_df: pd.DataFrame) -> pd.Series:
+    return (rig_df["Mandal"] == 1) & (rig_df["Sukta"] == 1) & (rig_df["Mantra Number"] == 1)
 
 
 def test_end_to_end(tmp_path):
@@ -37,7 +45,7 @@ def test_end_to_end(tmp_path):
     yaj_small = tmp_path / "yaj_small.csv"
     sam_small = tmp_path / "sam_small.csv"
 
-    _subset_csv(rig_full, rig_small, n=20)
+    rig_df = _subset_csv(rig_full, rig_small, n=20)
     _subset_csv(yaj_full, yaj_small, n=20)
     _subset_csv(sam_full, sam_small, n=20)
 
@@ -46,17 +54,22 @@ def test_end_to_end(tmp_path):
 
     # Train a tiny model
     model_out = tmp_path / "baseline_meter_clf.joblib"
-    _, df_test = train_baseline(str(out_enriched), str(model_out), report_out=None)
+    _, df_test = train_baseline(
+        str(out_enriched),
+        str(model_out),
+        report_out=None,
+        lg_vectorizer_path=str(tmp_path / "lg_vectorizer.joblib"),
+    )
 
     # Ensure we have at least one prediction
     assert not df_test.empty
     assert "meter_pred" in df_test.columns
 
-    # Run analyze_verse on RV 1.1.1 text (from your Rigveda CSV)
-    rig_df = pd.read_csv(rig_full)
-    rv_111 = rig_df[
-        (rig_df["Mandal"] == 1) & (rig_df["Sukta"] == 1) & (rig_df["Mantra Number"] == 1)
-    ]["MantraText"].iloc[0]
+    # Run analyze_verse on RV 1.1.1 text (from your Rigveda CSV); it is
+    # normally among the subset rows, so the full file is a fallback only
+    if not _is_rv_111(rig_df).any():
+        rig_df = pd.read_csv(rig_full)
+    rv_111 = rig_df[_is_rv_111(rig_df)]["MantraText"].iloc[0]
 
     # Just check that analyze_verse runs without error
     analyze_verse(rv_111)
@@ -0,0 +1,32 @@
+"""
+tests/test_gemini_cache.py
+
+Unit tests for the Gemini response cache in user_input.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+# user_input needs the OCR stack (OpenCV, Tesseract, EasyOCR, ...)
+user_input = pytest.importorskip("user_input")
+
+
+def test_unwritable_cache_falls_back_to_uncached_calls(tmp_path, monkeypatch):
+    # sqlite cannot create a database inside a missing directory
+    monkeypatch.setitem(
+        user_input.CONFIG, "GEMINI_CACHE_PATH", str(tmp_path / "missing" / "cache.sqlite3")
+    )
+    monkeypatch.setitem(user_input.CONFIG, "GEMINI_CACHE", "enabled")
+    monkeypatch.setattr(user_input, "_CACHE_CONN", None)
+
+    calls = []
+
+    @user_input._cached_gemini
+    def generate(prompt, model_name=None):
+        calls.append(prompt)
+        return f"response to {prompt}"
+
+    assert generate("a", "model") == "response to a"
+    assert generate("a", "model") == "response to a"
+    assert calls == ["a", "a"]
@@ -45,3 +45,12 @@ def test_full_normalize_pipeline():
     assert "॑" not in out and "॒" not in out
     assert " | " in out and " || " in out
     assert "  " not in out
+
+
+def test_normalize_text_is_memoized():
+    s = "अ॒ग्निमी॑ळे पु॒रोहि॑तं।"
+    first = normalize_text(s, strip_svaras=True)
+    hits = normalize_text.cache_info().hits
+    # Repeated inputs are served from the cache, not re-normalized
+    assert normalize_text(s, strip_svaras=True) is first
+    assert normalize_text.cache_info().hits == hits + 1
@@ -0,0 +1,17 @@
+"""
+tests/test_padapatha_lookup.py
+
+Unit tests for src.padapatha_lookup
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from src.padapatha_lookup import _first_position_index
+
+
+def test_first_position_index_keeps_first_occurrence():
+    keys = pd.Series(["क", "ख", "क", "ग", "ख"])
+    idx = _first_position_index(keys)
+    assert idx == {"क": 0, "ख": 1, "ग": 3}
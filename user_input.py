@@ -10,10 +10,17 @@ UPDATED: Render-ready path logic and error handling.
 import os
 import sys
 import argparse
+import hashlib
 import json
+import queue
+import sqlite3
+import tempfile
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Tuple, Dict, Optional
+import functools
 import unicodedata
 
 # Third-party imports
@@ -32,6 +39,12 @@ try:
 except ImportError:
     pass
 
+# Optional fast JSON serializer for the summaries; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Gemini SDK
 try:
     import google.generativeai as genai
@@ -52,12 +65,80 @@ CONFIG = {
     
     "EASYOCR_LANGS": ['hi', 'en'],
     "TESS_LANGS": "hin+eng",
+
+    # Page denoising: "bilateral" (edge-preserving, single pass), "median"
+    # (3x3) or "nlm" (non-local means; much slower at 300 DPI)
+    "DENOISE": os.getenv("DENOISE", "bilateral").lower(),
+    # Pages whose estimated pixel noise (std-dev, in gray levels) is below
+    # this are clean enough to skip denoising
+    "DENOISE_MIN_SIGMA": float(os.getenv("DENOISE_MIN_SIGMA", "2.0")),
+    # Preprocessed pages with less than this fraction of dark pixels are
+    # treated as blank and not OCR'd
+    "BLANK_PAGE_MAX_INK": float(os.getenv("BLANK_PAGE_MAX_INK", "0.002")),
     
     # UPDATED: 'models/gemini-2.5-flash' does not exist yet. Using standard 1.5 flash.
     "GEMINI_MODEL": "gemini-2.5-flash", 
     "GEMINI_API_ENV": "GEMINI_API_KEY",
+
+    # Pages OCR'd / sent to Gemini concurrently, and the cap on in-flight
+    # Gemini requests across all pages (keeps us under rate limits).
+    "PAGE_WORKERS": int(os.getenv("PAGE_WORKERS", "4")),
+    # Same-size pages per EasyOCR readtext_batched call
+    "EASYOCR_BATCH": int(os.getenv("EASYOCR_BATCH", "4")),
+    # Pages of a document held in memory and processed together at a time
+    "PAGE_WINDOW": int(os.getenv("PAGE_WINDOW", "8")),
+    "GEMINI_MAX_CONCURRENCY": int(os.getenv("GEMINI_MAX_CONCURRENCY", "4")),
+    # Requests / (estimated) tokens per minute allowed to Gemini; 0 = no limit.
+    "GEMINI_RPM": float(os.getenv("GEMINI_RPM", "0")),
+    "GEMINI_TPM": float(os.getenv("GEMINI_TPM", "0")),
+
+    # Gemini response cache (SQLite, keyed by model + prompt):
+    #   enabled  - serve repeated prompts from the cache, store new responses
+    #   replay   - cache only; a miss raises (reproducible offline reruns)
+    #   disabled - always call Gemini
+    "GEMINI_CACHE": os.getenv("GEMINI_CACHE", "enabled").lower(),
+    "GEMINI_CACHE_PATH": os.getenv(
+        "GEMINI_CACHE_PATH",
+        str(Path(__file__).resolve().parent / ".gemini_cache.sqlite3"),
+    ),
 }
 
+class TokenBucket:
+    """Rate limiter over requests and tokens per minute.
+
+    Each budget refills continuously up to one minute's worth; acquire()
+    blocks until both have room for one request of `tokens` tokens. A rate
+    of 0 disables that budget.
+    """
+    def __init__(self, rpm: float, tpm: float):
+        self.rates = (rpm / 60.0, tpm / 60.0)
+        self.levels = [rpm, tpm]
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                elapsed, self.stamp = now - self.stamp, now
+                wait = 0.0
+                for i, (rate, need) in enumerate(zip(self.rates, (1, tokens))):
+                    if not rate: continue
+                    # A request larger than the whole budget waits for a full one
+                    need = min(need, rate * 60.0)
+                    self.levels[i] = min(rate * 60.0, self.levels[i] + elapsed * rate)
+                    wait = max(wait, (need - self.levels[i]) / rate)
+                if wait <= 0:
+                    for i, (rate, need) in enumerate(zip(self.rates, (1, tokens))):
+                        if rate: self.levels[i] -= min(need, rate * 60.0)
+                    return
+            time.sleep(wait)
+
+_GEMINI_SLOTS = threading.BoundedSemaphore(CONFIG["GEMINI_MAX_CONCURRENCY"])
+_GEMINI_BUCKET = TokenBucket(CONFIG["GEMINI_RPM"], CONFIG["GEMINI_TPM"])
+# Independent Gemini stages of one page run side by side on this pool
+_GEMINI_EXECUTOR = ThreadPoolExecutor(max_workers=max(1, CONFIG["GEMINI_MAX_CONCURRENCY"]))
+
 # -----------------------
 # VALIDATION LOGIC (Crucial for Render)
 # -----------------------
@@ -77,14 +158,19 @@ if CONFIG.get("POPPLER_PATH") and not os.path.exists(CONFIG["POPPLER_PATH"]):
 # Initialize EasyOCR reader once (CPU is safer for free-tier Render)
 print("Initializing EasyOCR...")
 READER = easyocr.Reader(CONFIG["EASYOCR_LANGS"], gpu=False)
+# The shared reader is not documented as thread-safe; pages run in threads.
+_READER_LOCK = threading.Lock()
 
 # -----------------------
 # Utility helpers
 # -----------------------
 def normalize_unicode(text: Optional[str]) -> str:
     s = (text or "")
-    s = unicodedata.normalize('NFKC', s)
-    s = s.replace('\u200b', '')
+    # Gemini output is usually NFKC already; the check is cheaper than a rebuild
+    if not unicodedata.is_normalized('NFKC', s):
+        s = unicodedata.normalize('NFKC', s)
+    if '\u200b' in s:
+        s = s.replace('\u200b', '')
     return s
 
 def load_image_cv(path: str) -> np.ndarray:
@@ -93,21 +179,55 @@ def load_image_cv(path: str) -> np.ndarray:
         raise RuntimeError(f"Failed to load image: {path}")
     return img
 
-def save_img(path: Path, img: np.ndarray):
-    cv2.imwrite(str(path), img)
+# PNG: lowest DEFLATE effort (still lossless); JPEG for the debug snapshots
+_IMG_PARAMS = {".png": [cv2.IMWRITE_PNG_COMPRESSION, 1], ".jpg": [cv2.IMWRITE_JPEG_QUALITY, 80]}
+
+def save_img(path: Path, img: np.ndarray, writer: Optional["FileWriter"]=None):
+    """Encode `img` by the suffix of `path`; the write goes to `writer` if given."""
+    path = Path(path)
+    ok, buf = cv2.imencode(path.suffix, img, _IMG_PARAMS.get(path.suffix.lower(), []))
+    if not ok:
+        raise RuntimeError(f"Failed to encode image: {path}")
+    if writer is not None:
+        writer.put(path, buf.tobytes())
+    else:
+        with open(path, "wb") as fh: fh.write(buf.tobytes())
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
 
 def safe_json(x):
     if x is None or isinstance(x,(str,int,float,bool)):
         return x
     if isinstance(x,(list,tuple)):
+        # Flat lists of scalars (most of a summary) need no per-item walk
+        if all(type(i) in _JSON_SCALARS for i in x):
+            return list(x)
         return [safe_json(i) for i in x]
     if isinstance(x,dict):
+        if all(type(k) is str and type(v) in _JSON_SCALARS for k,v in x.items()):
+            return dict(x)
         return {str(k): safe_json(v) for k,v in x.items()}
     try:
         return str(x)
     except:
         return None
 
+def write_json(path: Path, obj):
+    """Write `obj` (after safe_json) as indented UTF-8 JSON."""
+    obj = safe_json(obj)
+    if orjson is not None:
+        try:
+            # Same layout as json.dump(..., ensure_ascii=False, indent=2)
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits: let stdlib json handle it
+        else:
+            with open(path, "wb") as fb:
+                fb.write(data)
+            return
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(obj, fh, ensure_ascii=False, indent=2)
+
 # -----------------------
 # Image preprocessing
 # -----------------------
@@ -118,9 +238,12 @@ def deskew_no_clip(img: np.ndarray) -> np.ndarray:
         thresh = cv2.threshold(inv, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
     except Exception:
         thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
-    coords = np.column_stack(np.where(thresh > 0))
-    if coords.size == 0:
+    # int32 (x, y) points straight from OpenCV; swapped to the (row, col)
+    # order the angle convention below was written for
+    pts = cv2.findNonZero(thresh)
+    if pts is None:
         return img
+    coords = np.ascontiguousarray(pts.reshape(-1, 2)[:, ::-1])
     angle = cv2.minAreaRect(coords)[-1]
     if angle < -45:
         angle = -(90 + angle)
@@ -139,21 +262,45 @@ def deskew_no_clip(img: np.ndarray) -> np.ndarray:
 
 def denoise(img: np.ndarray) -> np.ndarray:
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    den = cv2.fastNlMeansDenoising(gray, None, h=10, templateWindowSize=7, searchWindowSize=21)
+    # Robust noise estimate: the median absolute Laplacian ignores the
+    # sparse text edges (which dominate its std-dev), and /(0.6745*sqrt(20))
+    # turns it into the pixel noise std-dev. Every other pixel is enough.
+    # Clean / already-binarized scans score ~0-1, and filtering them gains nothing
+    lap = cv2.Laplacian(gray, cv2.CV_16S)
+    noise_sigma = np.median(np.abs(lap[::2, ::2])) / (0.6745 * np.sqrt(20))
+    if noise_sigma < CONFIG["DENOISE_MIN_SIGMA"]:
+        return img
+    method = CONFIG["DENOISE"]
+    if method == "nlm":
+        den = cv2.fastNlMeansDenoising(gray, None, h=10, templateWindowSize=7, searchWindowSize=21)
+    elif method == "median":
+        den = cv2.medianBlur(gray, 3)
+    elif cv2.ocl.haveOpenCL():
+        # Transparent API: runs the filter on the OpenCL device
+        den = cv2.bilateralFilter(cv2.UMat(gray), 5, 50, 50).get()
+    else:
+        den = cv2.bilateralFilter(gray, 5, 50, 50)
     return cv2.cvtColor(den, cv2.COLOR_GRAY2BGR)
 
 def enhance_contrast(img: np.ndarray) -> np.ndarray:
-    lab = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)
-    l,a,b = cv2.split(lab)
+    """CLAHE-equalized lightness (Lab L channel) of a BGR page, as uint8 gray.
+
+    OCR only needs this one channel, so a/b are dropped instead of being
+    merged back and converted to BGR (and then to gray again).
+    """
+    l = cv2.extractChannel(cv2.cvtColor(img, cv2.COLOR_BGR2LAB), 0)
     clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8,8))
-    l2 = clahe.apply(l)
-    lab2 = cv2.merge((l2,a,b))
-    return cv2.cvtColor(lab2, cv2.COLOR_LAB2BGR)
+    return clahe.apply(l)
 
-def adjust_gamma(img: np.ndarray, gamma: float=1.0) -> np.ndarray:
+@functools.lru_cache(maxsize=None)
+def _gamma_lut(gamma: float) -> np.ndarray:
     invGamma = 1.0 / gamma
-    table = np.array([((i/255.0)**invGamma)*255 for i in np.arange(256)]).astype("uint8")
-    return cv2.LUT(img, table)
+    table = (((np.arange(256) / 255.0) ** invGamma) * 255).astype("uint8")
+    table.flags.writeable = False
+    return table
+
+def adjust_gamma(img: np.ndarray, gamma: float=1.0) -> np.ndarray:
+    return cv2.LUT(img, _gamma_lut(gamma))
 
 def unsharp_mask(img: np.ndarray, radius=1, amount=0.8) -> np.ndarray:
     blurred = cv2.GaussianBlur(img, (0,0), radius)
@@ -163,19 +310,25 @@ def unsharp_mask(img: np.ndarray, radius=1, amount=0.8) -> np.ndarray:
 # OCR ensemble
 # -----------------------
 def ocr_tesseract_cv_with_lines(img_cv: np.ndarray, lang: str=None):
-    pil = Image.fromarray(cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB))
+    # A contiguous gray page is wrapped by PIL without a copy (fromarray
+    # goes through Image.frombuffer); only BGR input needs a converted copy
+    pil = Image.fromarray(img_cv if img_cv.ndim == 2 else cv2.cvtColor(img_cv, cv2.COLOR_BGR2RGB))
     lang = lang or CONFIG["TESS_LANGS"]
     data = pytesseract.image_to_data(pil, lang=lang, output_type=pytesseract.Output.DICT)
 
+    texts = data.get('text', [])
+    n = len(texts)
+    # Missing columns default once here, not per word
+    confs = data['conf'] if 'conf' in data else [None]*n
+    blks = data.get('block_num', [0]*n)
+    pars = data.get('par_num', [0]*n)
+    lns = data.get('line_num', [0]*n)
+
     words = []
-    lines_map = {}
-    order_keys = []
-    n = len(data.get('text', []))
-    for i in range(n):
-        w = data['text'][i]
+    lines_map = {}  # (block, par, line) -> words, in first-seen order
+    for w, conf_raw, blk, par, ln in zip(texts, confs, blks, pars, lns):
         if not w or str(w).strip() == "":
             continue
-        conf_raw = data.get('conf', [None]*n)[i] if 'conf' in data else None
         try:
             if conf_raw is None or str(conf_raw).strip() == "":
                 conf_val = -1
@@ -184,30 +337,106 @@ def ocr_tesseract_cv_with_lines(img_cv: np.ndarray, lang: str=None):
         except:
             conf_val = -1
         words.append({"word": w, "conf": conf_val})
+        lines_map.setdefault((int(blk), int(par), int(ln)), []).append(w)
 
-        blk = int(data.get('block_num', [0]*n)[i])
-        par = int(data.get('par_num', [0]*n)[i])
-        ln = int(data.get('line_num', [0]*n)[i])
-        key = (blk, par, ln)
-        if key not in lines_map:
-            lines_map[key] = []
-            order_keys.append(key)
-        lines_map[key].append(w)
-
-    lines = []
-    for k in order_keys:
-        lines.append(" ".join(lines_map.get(k, [])))
+    lines = [" ".join(ws) for ws in lines_map.values()]
     text_with_lines = "\n".join(lines).strip()
     full_text = " ".join([w['word'] for w in words]).strip()
     return full_text, words, text_with_lines
 
 def ocr_easyocr_cv(img_cv: np.ndarray):
-    res = READER.readtext(img_cv)
+    with _READER_LOCK:
+        res = READER.readtext(img_cv)
+    return ocr_easyocr_from_result(res)
+
+def ocr_easyocr_from_result(res):
     words=[]; parts=[]
     for bbox, txt, conf in res:
         parts.append(txt); words.append({"word":txt,"conf":float(conf)})
     return " ".join(parts), words
 
+def ocr_easyocr_batched(imgs: List[np.ndarray]) -> List[Optional[Tuple[str, List[Dict]]]]:
+    """EasyOCR for several pages, as ocr_easyocr_cv would give per page.
+
+    Pages of equal size go through READER.readtext_batched together (up
+    to CONFIG["EASYOCR_BATCH"] per call), so the detector runs on stacked
+    inputs. A page whose batch fails gets None.
+    """
+    out: List[Optional[Tuple[str, List[Dict]]]] = [None] * len(imgs)
+    by_shape: Dict[tuple, List[int]] = {}
+    for i, im in enumerate(imgs):
+        by_shape.setdefault(im.shape, []).append(i)
+    size = max(1, CONFIG["EASYOCR_BATCH"])
+    for idxs in by_shape.values():
+        for start in range(0, len(idxs), size):
+            batch = idxs[start:start + size]
+            try:
+                with _READER_LOCK:
+                    if len(batch) > 1 and hasattr(READER, "readtext_batched"):
+                        results = READER.readtext_batched([imgs[i] for i in batch])
+                    else:
+                        results = [READER.readtext(imgs[i]) for i in batch]
+            except Exception as e:
+                print(f"EasyOCR batch failed, falling back to per-page OCR: {e}")
+                continue
+            for i, res in zip(batch, results):
+                out[i] = ocr_easyocr_from_result(res)
+    return out
+
+def is_blank_page(gray: np.ndarray) -> bool:
+    """True if (almost) no pixel of the preprocessed page is dark ink."""
+    ink = gray.size - cv2.countNonZero(cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)[1])
+    return ink < CONFIG["BLANK_PAGE_MAX_INK"] * gray.size
+
+def ocr_cache_path(img_cv: np.ndarray, cache_dir: Path) -> Path:
+    """Cache file for a page's OCR: a hash of the image and OCR languages."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{img_cv.shape}|{img_cv.dtype}|{CONFIG['TESS_LANGS']}|{','.join(CONFIG['EASYOCR_LANGS'])}".encode())
+    h.update(np.ascontiguousarray(img_cv).data)
+    return Path(cache_dir) / f"{h.hexdigest()}.json"
+
+def ocr_both(img_cv: np.ndarray, cache_dir: Optional[Path]=None,
+             easy: Optional[Tuple[str, List[Dict]]]=None,
+             cache_path: Optional[Path]=None):
+    """Tesseract + EasyOCR results for a preprocessed page.
+
+    With `cache_dir`, results are stored there as JSON under a hash of the
+    image and OCR languages, so rerunning a document (e.g. with other
+    Gemini flags) skips OCR for unchanged pages. `cache_path`, if given, is
+    the page's already computed ocr_cache_path (saves hashing the image
+    again). `easy`, if given, is the page's already computed
+    (easy_text, easy_words).
+    Returns (tess_fulltext, tess_words, tess_lines_text, easy_text, easy_words).
+    Blank pages (is_blank_page) get empty results without running OCR.
+    """
+    if is_blank_page(img_cv):
+        return "", [], "", "", []
+    if cache_path is None and cache_dir is not None:
+        cache_path = ocr_cache_path(img_cv, cache_dir)
+    if cache_path is not None:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as fh:
+                cached = tuple(json.load(fh))
+            if len(cached) == 5:
+                return cached
+        except (OSError, ValueError, TypeError):
+            pass
+
+    tess_fulltext, tess_words, tess_lines_text = ocr_tesseract_cv_with_lines(img_cv)
+    easy_text, easy_words = easy if easy is not None else ocr_easyocr_cv(img_cv)
+    out = (tess_fulltext, tess_words, tess_lines_text, easy_text, easy_words)
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(out, fh, ensure_ascii=False)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+    return out
+
 def merge_ensemble(tess_text, tess_words, easy_text, easy_words):
     def avg_conf(lst):
         vals = [w.get("conf",-1) for w in lst if isinstance(w.get("conf",None),(int,float)) and w.get("conf",-1)>=0]
@@ -221,35 +450,33 @@ def merge_ensemble(tess_text, tess_words, easy_text, easy_words):
 # -----------------------
 # PDF/DOCX helpers
 # -----------------------
-def pdf_to_images(pdf_path: str, dpi=300):
-    # Uses CONFIG['POPPLER_PATH'] which is None on Render (correct) or Path on Windows
-    pages = convert_from_path(pdf_path, dpi=dpi, poppler_path=CONFIG.get("POPPLER_PATH"))
-    return [cv2.cvtColor(np.array(p), cv2.COLOR_RGB2BGR) for p in pages]
-
-def docx_to_images(docx_path: str, out_folder: str):
+def pdf_to_images(pdf_path: str, dpi=300) -> Iterator[np.ndarray]:
+    # Uses CONFIG['POPPLER_PATH'] which is None on Render (correct) or Path on Windows.
+    # Pages are rasterized by several pdftoppm processes into a temp folder
+    # (lossless PPM) and decoded lazily, one BGR page per iteration, so a
+    # long PDF never has all its pages in memory at once.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pages = convert_from_path(
+            pdf_path, dpi=dpi, poppler_path=CONFIG.get("POPPLER_PATH"),
+            thread_count=max(1, (os.cpu_count() or 1) - 1), output_folder=tmpdir,
+        )
+        for p in pages:
+            img = cv2.cvtColor(np.array(p), cv2.COLOR_RGB2BGR)
+            p.close()
+            yield img
+
+def docx_to_text(docx_path: str) -> str:
+    """Non-empty paragraphs of a .docx, one per line (no OCR needed)."""
     doc = Document(docx_path)
-    imgs = []
-    from PIL import Image as PILImage, ImageDraw, ImageFont
-    # Simple fallback font
-    font = ImageFont.load_default()
-    for i,p in enumerate(doc.paragraphs):
-        txt = p.text.strip()
-        if not txt: continue
-        lines = txt.split("\n")
-        w,h = 1200, 60 + 12*len(lines)
-        im = PILImage.new("RGB",(w,h),color="white")
-        draw = ImageDraw.Draw(im)
-        y=10
-        for line in lines:
-            draw.text((10,y), line, fill="black", font=font); y+=12
-        path = os.path.join(out_folder, f"docx_{i}.png")
-        im.save(path); imgs.append(path)
-    return imgs
+    return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
 
 # -----------------------
 # Gemini helpers
 # -----------------------
 def _init_gemini():
+    if CONFIG["GEMINI_CACHE"] == "replay":
+        # Every response comes from the cache; no SDK or API key needed
+        return
     if genai is None:
         raise RuntimeError("google.generativeai not installed")
     
@@ -274,17 +501,90 @@ def _init_gemini():
     
     genai.configure(api_key=api_key)
 
+_CACHE_CONN: Optional[sqlite3.Connection] = None
+_CACHE_LOCK = threading.Lock()
+
+def _gemini_cache() -> sqlite3.Connection:
+    """Shared connection to the response cache, opened on first use.
+
+    Pages call Gemini from several threads, so the one connection is
+    shared and every statement on it runs under _CACHE_LOCK.
+    Raises sqlite3.Error if the cache file cannot be opened or created.
+    """
+    global _CACHE_CONN
+    if _CACHE_CONN is None:
+        conn = sqlite3.connect(CONFIG["GEMINI_CACHE_PATH"], check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, response TEXT, ts INTEGER)")
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _CACHE_CONN = conn
+    return _CACHE_CONN
+
+def _cached_gemini(fn):
+    """Serve `fn(prompt, model_name, ...)` from the response cache.
+
+    The key is SHA-256 of model name + prompt; only successful responses
+    are stored. Behaviour follows CONFIG["GEMINI_CACHE"] (see CONFIG).
+    The cache is best-effort: if it cannot be opened, read or written
+    (read-only checkout, locked database, full disk), `fn` runs uncached.
+    """
+    @functools.wraps(fn)
+    def wrapper(prompt: str, model_name: str=None, *args, **kwargs):
+        policy = CONFIG["GEMINI_CACHE"]
+        if policy == "disabled":
+            return fn(prompt, model_name, *args, **kwargs)
+
+        model_name = model_name or CONFIG.get("GEMINI_MODEL")
+        key = hashlib.sha256(f"{model_name}\0{prompt}".encode("utf-8")).hexdigest()
+        try:
+            with _CACHE_LOCK:
+                row = _gemini_cache().execute("SELECT response FROM cache WHERE key=?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Gemini cache unavailable ({e}); calling uncached")
+            return fn(prompt, model_name, *args, **kwargs)
+        if row is not None:
+            return row[0]
+        if policy == "replay":
+            raise RuntimeError(f"Gemini cache miss in replay mode (key {key[:12]})")
+
+        text = fn(prompt, model_name, *args, **kwargs)
+        try:
+            with _CACHE_LOCK:
+                conn = _gemini_cache()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache(key, response, ts) VALUES (?, ?, ?)",
+                    (key, text, int(time.time())),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Gemini cache write failed: {e}")
+        return text
+    return wrapper
+
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str):
+    # One client per model name, shared by all stages and page threads
+    return genai.GenerativeModel(model_name)
+
+@_cached_gemini
 def _generate_with_backoff(prompt: str, model_name: str=None, max_retries:int=4, initial_backoff:float=1.0):
     model_name = model_name or CONFIG.get("GEMINI_MODEL")
     if not model_name:
         raise RuntimeError("No Gemini model configured")
     
-    model = genai.GenerativeModel(model_name)
+    model = _get_model(model_name)
     attempt = 0; backoff = initial_backoff
     
     while attempt <= max_retries:
         try:
-            resp = model.generate_content(prompt)
+            # ~4 characters per token
+            _GEMINI_BUCKET.acquire(len(prompt) // 4)
+            with _GEMINI_SLOTS:
+                resp = model.generate_content(prompt)
             return getattr(resp, "text", str(resp))
         except ResourceExhausted as e:
             print(f"Gemini quota exhausted, retrying in {backoff}s...")
@@ -340,6 +640,51 @@ def gemini_extract_only_mantra(full_text_with_swara: str) -> str:
     """
     return _generate_with_backoff(prompt)
 
+GEMINI_ALL_FIELDS = ("cleaned_no_swara", "cleaned_swara", "only_shloka", "roman", "translated")
+
+def gemini_do_all(ocr_text: str, do_romanize: bool, do_translate: bool) -> Dict[str, Optional[str]]:
+    """All Gemini stages for one text in a single request.
+
+    Returns a dict with every key of GEMINI_ALL_FIELDS ("roman" /
+    "translated" are None unless requested). Raises ValueError if the
+    response is not the expected JSON object.
+    """
+    fields = [
+        '"cleaned_no_swara": the text with OCR errors cleaned, in normal orthography (NO Vedic Swara marks)',
+        '"cleaned_swara": the cleaned text with Vedic prosodic marks (UDATTA ◌॑ and ANUDATTA ◌॒) added where appropriate',
+        '"only_shloka": only the Sanskrit Shloka/Mantra lines of "cleaned_swara" (remove all Hindi/English commentary, word meanings (Padarth), Anvay, Bhashya, headers and extraneous text; keep the Swara exactly)',
+    ]
+    if do_romanize:
+        fields.append('"roman": "only_shloka" transliterated to IAST with diacritics, preserving svāra marks')
+    if do_translate:
+        fields.append('"translated": the English translation of "only_shloka"')
+    field_list = "\n    ".join(f"- {f}" for f in fields)
+    prompt = f"""
+    You are an expert Devanagari/Vedic linguist and editor.
+    Task: Process the OCR text below and return ONE JSON object with these string fields:
+    {field_list}
+
+    - PRESERVE THE ORIGINAL LINE BREAKS in every field (as \\n).
+    - Output ONLY the JSON object.
+
+    Text:
+    \"\"\"{ocr_text}\"\"\""""
+    raw = _generate_with_backoff(prompt).strip()
+    if raw.startswith("```"):
+        raw = raw.split("\n", 1)[1] if "\n" in raw else ""
+        raw = raw.rsplit("```", 1)[0]
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Gemini did not return JSON: {e}") from e
+
+    wanted = ["cleaned_no_swara", "cleaned_swara", "only_shloka"]
+    if do_romanize: wanted.append("roman")
+    if do_translate: wanted.append("translated")
+    if not isinstance(data, dict) or not all(isinstance(data.get(k), str) for k in wanted):
+        raise ValueError("Gemini JSON is missing fields")
+    return {k: (data[k] if k in wanted else None) for k in GEMINI_ALL_FIELDS}
+
 # -----------------------
 # Reflow helper
 # -----------------------
@@ -366,19 +711,112 @@ def reflow_to_lines(original_lines: List[str], cleaned_text: str) -> str:
         lines.append(" ".join(words[idx: idx + a])); idx += a
     return "\n".join(lines)
 
+# -----------------------
+# Gemini stages
+# -----------------------
+def _with_line_breaks(text: str, cleaned: str) -> str:
+    cleaned = normalize_unicode(cleaned)
+    if "\n" not in cleaned:
+        orig_lines = [l for l in text.split("\n") if l.strip()]
+        cleaned = reflow_to_lines(orig_lines, cleaned)
+    return cleaned
+
+def run_gemini_stages(text: str, args, result: Dict) -> Tuple[Optional[str], ...]:
+    """Clean, extract, romanize and translate `text` with Gemini.
+
+    Tries one combined request (gemini_do_all) first and falls back to the
+    per-stage calls if its answer can't be used. Failures are recorded in
+    result["notes"]. Returns (cleaned_no_swara, cleaned_swara, only_shloka,
+    roman, translated); unavailable stages are None.
+    """
+    try:
+        out = gemini_do_all(text, args.do_romanize, args.do_translate)
+        return (
+            _with_line_breaks(text, out["cleaned_no_swara"]),
+            _with_line_breaks(text, out["cleaned_swara"]),
+            normalize_unicode(out["only_shloka"]),
+            out["roman"],
+            out["translated"],
+        )
+    except Exception as e:
+        result.setdefault("notes", []).append(f"gemini_do_all_failed:{str(e)}")
+    return _run_gemini_stages_separately(text, args, result)
+
+def _run_gemini_stages_separately(text: str, args, result: Dict) -> Tuple[Optional[str], ...]:
+    cleaned_no_swara = None
+    cleaned_swara = None
+    only_shloka = None
+    roman = None
+    translated = None
+
+    # 1. Clean No Swara / 2. Clean With Swara (Full Text), both from the raw text
+    fut_no = _GEMINI_EXECUTOR.submit(gemini_clean_no_swara, text)
+    fut_sw = _GEMINI_EXECUTOR.submit(gemini_clean_with_swara_vedic, text)
+    try:
+        cleaned_no_swara = _with_line_breaks(text, fut_no.result())
+    except Exception as e:
+        result.setdefault("notes", []).append(f"clean_no_swara_failed:{str(e)}")
+    try:
+        cleaned_swara = _with_line_breaks(text, fut_sw.result())
+    except Exception as e:
+        result.setdefault("notes", []).append(f"clean_with_swara_failed:{str(e)}")
+
+    # 3. Extract ONLY Mantra
+    base_for_extraction = cleaned_swara if cleaned_swara else (cleaned_no_swara or text)
+    if base_for_extraction:
+        try:
+            only_shloka = normalize_unicode(gemini_extract_only_mantra(base_for_extraction))
+        except Exception as e:
+            result.setdefault("notes", []).append(f"extract_shloka_failed:{str(e)}")
+
+    # 4. Romanize/Translate
+    base_for_roman = only_shloka if only_shloka else (cleaned_swara or cleaned_no_swara or text)
+    fut_roman = fut_trans = None
+    if args.do_romanize and base_for_roman:
+        fut_roman = _GEMINI_EXECUTOR.submit(gemini_romanize, base_for_roman)
+    if args.do_translate and base_for_roman:
+        fut_trans = _GEMINI_EXECUTOR.submit(gemini_translate, base_for_roman)
+    if fut_roman is not None:
+        try:
+            roman = fut_roman.result()
+        except Exception as e:
+            result.setdefault("notes", []).append(f"romanize_failed:{str(e)}")
+    if fut_trans is not None:
+        try:
+            translated = fut_trans.result()
+        except Exception as e:
+            result.setdefault("notes", []).append(f"translate_failed:{str(e)}")
+
+    return cleaned_no_swara, cleaned_swara, only_shloka, roman, translated
+
 # -----------------------
 # Image page processing
 # -----------------------
-def process_image(img_cv: np.ndarray, args) -> Tuple[np.ndarray, np.ndarray, Dict]:
+def preprocess_page(img_cv: np.ndarray, args) -> Tuple[np.ndarray, np.ndarray]:
+    """(original copy, preprocessed gray page ready for OCR)"""
     original = img_cv.copy()
+    # Each stage is a single vectorized OpenCV call; they are kept separate
+    # (not fused into one custom kernel) so the output matches OpenCV's own
+    # CLAHE / LUT / Gaussian implementations exactly.
     img = deskew_no_clip(original)
     if not args.no_denoise: img = denoise(img)
+    # From here on the page is single-channel: the contrast-equalized
+    # lightness is what OCR reads
     img = enhance_contrast(img)
     img = adjust_gamma(img, gamma=0.9)
-    img = unsharp_mask(cv2.cvtColor(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR), radius=1, amount=0.8)
-
-    tess_fulltext, tess_words, tess_lines_text = ocr_tesseract_cv_with_lines(img)
-    easy_text, easy_words = ocr_easyocr_cv(img)
+    img = unsharp_mask(img, radius=1, amount=0.8)
+    return original, img
+
+def process_image(img_cv: np.ndarray, args, cache_dir: Optional[Path]=None,
+                  prepared: Optional[Tuple[np.ndarray, np.ndarray]]=None,
+                  easy: Optional[Tuple[str, List[Dict]]]=None,
+                  cache_path: Optional[Path]=None) -> Tuple[np.ndarray, np.ndarray, Dict]:
+    # `prepared` / `easy` / `cache_path`: this page's preprocess_page()
+    # output, EasyOCR result and OCR cache file, when already computed for
+    # a whole document
+    original, img = prepared if prepared is not None else preprocess_page(img_cv, args)
+    tess_fulltext, tess_words, tess_lines_text, easy_text, easy_words = \
+        ocr_both(img, cache_dir, easy, cache_path)
     merged = merge_ensemble(tess_fulltext, tess_words, easy_text, easy_words)
     ocr_text_for_gemini = tess_lines_text if tess_lines_text.strip() else merged["text"]
 
@@ -397,50 +835,10 @@ def process_image(img_cv: np.ndarray, args) -> Tuple[np.ndarray, np.ndarray, Dic
     if args.use_gemini:
         try:
             _init_gemini()
-            if args.force_gemini or merged["avg_confidence"] < args.gemini_threshold:
-                # 1. Clean No Swara
-                try:
-                    raw_no = gemini_clean_no_swara(ocr_text_for_gemini)
-                    raw_no = normalize_unicode(raw_no)
-                    if "\n" not in raw_no:
-                        orig_lines = [l for l in ocr_text_for_gemini.split("\n") if l.strip()]
-                        raw_no = reflow_to_lines(orig_lines, raw_no)
-                    cleaned_no_swara = raw_no
-                except Exception as e:
-                    result.setdefault("notes", []).append(f"clean_no_swara_failed:{str(e)}")
-
-                # 2. Clean With Swara (Full Text)
-                try:
-                    raw_sw = gemini_clean_with_swara_vedic(ocr_text_for_gemini)
-                    raw_sw = normalize_unicode(raw_sw)
-                    if "\n" not in raw_sw:
-                        orig_lines = [l for l in ocr_text_for_gemini.split("\n") if l.strip()]
-                        raw_sw = reflow_to_lines(orig_lines, raw_sw)
-                    cleaned_swara = raw_sw
-                except Exception as e:
-                    result.setdefault("notes", []).append(f"clean_with_swara_failed:{str(e)}")
-
-                # 3. Extract ONLY Mantra
-                base_for_extraction = cleaned_swara if cleaned_swara else (cleaned_no_swara or ocr_text_for_gemini)
-                if base_for_extraction:
-                    try:
-                        only_shloka = gemini_extract_only_mantra(base_for_extraction)
-                        only_shloka = normalize_unicode(only_shloka)
-                    except Exception as e:
-                          result.setdefault("notes", []).append(f"extract_shloka_failed:{str(e)}")
-
-                # 4. Romanize/Translate
-                base_for_roman = only_shloka if only_shloka else (cleaned_swara or cleaned_no_swara or ocr_text_for_gemini)
-                if args.do_romanize and base_for_roman:
-                    try:
-                        roman = gemini_romanize(base_for_roman)
-                    except Exception as e:
-                        result.setdefault("notes", []).append(f"romanize_failed:{str(e)}")
-                if args.do_translate and base_for_roman:
-                    try:
-                        translated = gemini_translate(base_for_roman)
-                    except Exception as e:
-                        result.setdefault("notes", []).append(f"translate_failed:{str(e)}")
+            # Nothing to clean on a blank page
+            if ocr_text_for_gemini.strip() and (args.force_gemini or merged["avg_confidence"] < args.gemini_threshold):
+                cleaned_no_swara, cleaned_swara, only_shloka, roman, translated = \
+                    run_gemini_stages(ocr_text_for_gemini, args, result)
         except Exception as e:
             result.setdefault("notes", []).append(f"gemini_init_failed:{str(e)}")
 
@@ -467,45 +865,8 @@ def process_plain_text(text: str, stem: str, out_dir: Path, args) -> Dict:
     if args.use_gemini:
         try:
             _init_gemini()
-            # Clean No Swara
-            try:
-                raw_no = gemini_clean_no_swara(text)
-                raw_no = normalize_unicode(raw_no)
-                if "\n" not in raw_no:
-                    orig_lines = [l for l in text.split("\n") if l.strip()]
-                    raw_no = reflow_to_lines(orig_lines, raw_no)
-                cleaned_no_swara = raw_no
-            except Exception as e:
-                res.setdefault("notes", []).append(f"clean_no_swara_failed:{str(e)}")
-
-            # Clean With Swara
-            try:
-                raw_sw = gemini_clean_with_swara_vedic(text)
-                raw_sw = normalize_unicode(raw_sw)
-                if "\n" not in raw_sw:
-                    orig_lines = [l for l in text.split("\n") if l.strip()]
-                    raw_sw = reflow_to_lines(orig_lines, raw_sw)
-                cleaned_swara = raw_sw
-            except Exception as e:
-                res.setdefault("notes", []).append(f"clean_with_swara_failed:{str(e)}")
-
-            # Extract ONLY Mantra
-            base_for_extraction = cleaned_swara if cleaned_swara else (cleaned_no_swara or text)
-            if base_for_extraction:
-                try:
-                    only_shloka = gemini_extract_only_mantra(base_for_extraction)
-                    only_shloka = normalize_unicode(only_shloka)
-                except Exception as e:
-                      res.setdefault("notes", []).append(f"extract_shloka_failed:{str(e)}")
-
-            # Roman/Translate
-            base_for_roman = only_shloka if only_shloka else (cleaned_swara or cleaned_no_swara or text)
-            if args.do_romanize and base_for_roman:
-                try: roman = gemini_romanize(base_for_roman)
-                except Exception as e: res.setdefault("notes", []).append(f"romanize_failed:{str(e)}")
-            if args.do_translate and base_for_roman:
-                try: translated = gemini_translate(base_for_roman)
-                except Exception as e: res.setdefault("notes", []).append(f"translate_failed:{str(e)}")
+            cleaned_no_swara, cleaned_swara, only_shloka, roman, translated = \
+                run_gemini_stages(text, args, res)
         except Exception as e:
             res.setdefault("notes", []).append(f"gemini_init_failed:{str(e)}")
 
@@ -530,14 +891,138 @@ def process_plain_text(text: str, stem: str, out_dir: Path, args) -> Dict:
         with open(out_dir / f"{stem}_eng.txt", "w", encoding="utf-8") as fh: fh.write(translated)
 
     summary = {"file": stem, "result": res}
-    with open(out_dir / f"{stem}_summary.json", "w", encoding="utf-8") as fh:
-        json.dump(safe_json(summary), fh, ensure_ascii=False, indent=2)
+    write_json(out_dir / f"{stem}_summary.json", summary)
     return summary
 
 # -----------------------
 # Orchestration
 # -----------------------
-def process_path(path: Path, out_dir: Path, args):
+class FileWriter:
+    """Writes output files on one background thread.
+
+    put() only queues the content, so page workers go on to the next page
+    instead of waiting on disk; close() returns once everything queued has
+    been written. Write errors are printed, as page errors are.
+    """
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Tuple[Path, object]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, path: Path, content):
+        """Queue `content` (str: UTF-8 text, bytes: written as is) for `path`."""
+        self._queue.put((path, content))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None: return
+            path, content = item
+            try:
+                if isinstance(content, bytes):
+                    with open(path, "wb") as fh: fh.write(content)
+                else:
+                    with open(path, "w", encoding="utf-8") as fh: fh.write(content)
+            except OSError as e:
+                print(f"Write error on {path}: {e}")
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+def _process_page(f: Path, i: int, img: np.ndarray, out_dir: Path, args,
+                  on_shloka: Optional[Callable[[Path, str], None]] = None,
+                  prepared: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                  easy: Optional[Tuple[str, List[Dict]]] = None,
+                  writer: Optional[FileWriter] = None,
+                  cache_path: Optional[Path] = None) -> Dict:
+    stem = f"{f.stem}_page{i}"
+    own_writer = writer is None
+    if own_writer: writer = FileWriter()
+    try:
+        orig, proc_img, res = process_image(img, args, cache_dir=out_dir / ".ocr_cache",
+                                            prepared=prepared, easy=easy, cache_path=cache_path)
+        # Encoding stays on this worker; only the disk writes are queued.
+        # The original is just a reference snapshot, so JPEG is enough.
+        save_img(out_dir / f"{stem}_orig.jpg", orig, writer)
+        save_img(out_dir / f"{stem}_processed.png", proc_img, writer)
+
+        if res.get("cleaned_no_swara"):
+            writer.put(out_dir / f"{stem}_cleaned_no_swara.txt", res["cleaned_no_swara"])
+        if res.get("cleaned_swara"):
+            writer.put(out_dir / f"{stem}_cleaned_swara.txt", res["cleaned_swara"])
+        if res.get("only_shloka"):
+            shloka_path = out_dir / f"{stem}_only_shloka.txt"
+            writer.put(shloka_path, res["only_shloka"])
+            if on_shloka is not None:
+                on_shloka(shloka_path, res["only_shloka"])
+        if res.get("roman_swara"):
+            writer.put(out_dir / f"{stem}_roman_swara.txt", res["roman_swara"])
+        if res.get("translated"):
+            writer.put(out_dir / f"{stem}_eng.txt", res["translated"])
+
+        return {
+            "page": i,
+            "cleaned_swara": res.get("cleaned_swara"),
+            "only_shloka": res.get("only_shloka"),
+            "notes": res.get("notes", [])
+        }
+    except Exception as e:
+        print(f"Page error on {stem}: {e}")
+        return {"page": i, "error": str(e)}
+    finally:
+        if own_writer: writer.close()
+
+def _page_windows(pages: Iterable[np.ndarray], size: int) -> Iterator[Tuple[int, List[np.ndarray]]]:
+    """(number of the first page, up to `size` pages) chunks of `pages`."""
+    window: List[np.ndarray] = []
+    first = 1
+    for img in pages:
+        window.append(img)
+        if len(window) >= max(1, size):
+            yield first, window
+            first += len(window); window = []
+    if window:
+        yield first, window
+
+def _prepare_pages(imgs: List[np.ndarray], cache_dir: Path, args, ex: ThreadPoolExecutor):
+    """Preprocess all pages of a file, then EasyOCR the uncached ones in batches.
+
+    Returns (prepared, easy, cache_paths), per page: preprocess_page()
+    output, EasyOCR result and ocr_cache_path, or None where that step
+    failed, was cached, does not apply (blank page), or is left to the page
+    itself (the page then redoes it and reports any error).
+    """
+    def prep(img):
+        try: return preprocess_page(img, args)
+        except Exception: return None
+    prepared = list(ex.map(prep, imgs))
+
+    cache_paths: List[Optional[Path]] = [
+        ocr_cache_path(p[1], cache_dir) if p is not None and not is_blank_page(p[1]) else None
+        for p in prepared
+    ]
+    todo = [i for i, c in enumerate(cache_paths) if c is not None and not c.exists()]
+    easy: List[Optional[Tuple[str, List[Dict]]]] = [None] * len(imgs)
+    for i, res in zip(todo, ocr_easyocr_batched([prepared[i][1] for i in todo])):
+        easy[i] = res
+    return prepared, easy, cache_paths
+
+def process_path(path: Path, out_dir: Path, args,
+                 on_shloka: Optional[Callable[[Path, str], None]] = None):
+    """
+    OCR (+ Gemini) every page of every file under `path`.
+
+    Pages of a file run concurrently (CONFIG["PAGE_WORKERS"] threads): the
+    work is tesseract subprocesses, OpenCV and Gemini HTTP calls, all of
+    which release the GIL. Pages are read CONFIG["PAGE_WINDOW"] at a time,
+    and EasyOCR runs first for each such window, in batches of same-size
+    pages. `on_shloka(path, text)` is called from a worker
+    thread as each page's shloka is ready, so callers can start downstream
+    analysis before the whole document is done. Output files are written by
+    a background FileWriter; all of them are on disk once this returns
+    (the *_only_shloka.txt at `path` may not be yet during the callback).
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
     items = []
     files = sorted(path.iterdir()) if path.is_dir() else [path]
@@ -545,52 +1030,46 @@ def process_path(path: Path, out_dir: Path, args):
         if f.is_dir(): continue
         ext = f.suffix.lower()
         print("Processing:", f)
-        imgs = []
         if ext == ".pdf":
-            try: imgs = pdf_to_images(str(f))
-            except Exception as e: print(f"PDF fail: {e}"); continue
+            pages = pdf_to_images(str(f))
         elif ext == ".docx":
-            tmp = out_dir / "docx_imgs"; tmp.mkdir(exist_ok=True)
-            img_paths = docx_to_images(str(f), str(tmp)); imgs = [load_image_cv(p) for p in img_paths]
+            # The text is already digital: clean it directly instead of OCR'ing a rendering of it
+            try: text = docx_to_text(str(f))
+            except Exception as e: print(f"DOCX fail: {e}"); continue
+            summary = process_plain_text(text, f.stem, out_dir, args)
+            only_shloka = summary["result"].get("only_shloka")
+            if only_shloka and on_shloka is not None:
+                on_shloka(out_dir / f"{f.stem}_only_shloka.txt", only_shloka)
+            items.append({"file": str(f), "summary": str(out_dir / f"{f.stem}_summary.json")})
+            continue
         elif ext in [".jpg",".jpeg",".png",".tiff",".bmp",".webp",".gif"]:
-            imgs = [load_image_cv(str(f))]
+            pages = iter([load_image_cv(str(f))])
         else:
             print("Skip:", ext); continue
 
         pages_summary = []
-        for i, img in enumerate(imgs, start=1):
-            stem = f"{f.stem}_page{i}"
-            try:
-                orig, proc_img, res = process_image(img, args)
-                orig_path = out_dir / f"{stem}_orig.png"
-                proc_path = out_dir / f"{stem}_processed.png"
-                save_img(orig_path, orig); save_img(proc_path, proc_img)
-
-                if res.get("cleaned_no_swara"):
-                    with open(out_dir / f"{stem}_cleaned_no_swara.txt", "w", encoding="utf-8") as fh: fh.write(res["cleaned_no_swara"])
-                if res.get("cleaned_swara"):
-                    with open(out_dir / f"{stem}_cleaned_swara.txt", "w", encoding="utf-8") as fh: fh.write(res["cleaned_swara"])
-                if res.get("only_shloka"):
-                    with open(out_dir / f"{stem}_only_shloka.txt", "w", encoding="utf-8") as fh: fh.write(res["only_shloka"])
-                if res.get("roman_swara"):
-                    with open(out_dir / f"{stem}_roman_swara.txt", "w", encoding="utf-8") as fh: fh.write(res["roman_swara"])
-                if res.get("translated"):
-                    with open(out_dir / f"{stem}_eng.txt", "w", encoding="utf-8") as fh: fh.write(res["translated"])
-
-                pages_summary.append({
-                    "page": i,
-                    "cleaned_swara": res.get("cleaned_swara"),
-                    "only_shloka": res.get("only_shloka"),
-                    "notes": res.get("notes", [])
-                })
-            except Exception as e:
-                print(f"Page error on {stem}: {e}")
-                pages_summary.append({"page": i, "error": str(e)})
+        writer = FileWriter()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, CONFIG["PAGE_WORKERS"])) as ex:
+                for first, imgs in _page_windows(pages, CONFIG["PAGE_WINDOW"]):
+                    prepared, easy, cache_paths = _prepare_pages(imgs, out_dir / ".ocr_cache", args, ex)
+                    pages_summary.extend(ex.map(
+                        lambda i: _process_page(f, first + i, imgs[i], out_dir, args, on_shloka,
+                                                prepared=prepared[i], easy=easy[i], writer=writer,
+                                                cache_path=cache_paths[i]),
+                        range(len(imgs)),
+                    ))
+        except Exception as e:
+            # Page errors are handled per page; this is the PDF rasterizer failing
+            print(f"PDF fail: {e}")
+            if not pages_summary: continue
+        finally:
+            # All page files are on disk before the summary / return
+            writer.close()
 
         summary_obj = {"file": str(f), "pages": pages_summary}
         summary_path = out_dir / f"{f.stem}_summary.json"
-        with open(summary_path, "w", encoding="utf-8") as fh:
-            json.dump(safe_json(summary_obj), fh, ensure_ascii=False, indent=2)
+        write_json(summary_path, summary_obj)
         items.append({"file": str(f), "summary": str(summary_path)})
     return items
 